@@ -11,9 +11,59 @@ as the directory HTML can change subtly year-to-year.
 """
 
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
 from typing import List, Dict
 
+try:
+    # C-backed libxml2 parser is several times faster than the pure-Python one
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+# Index pages are only mined for detail links, so scan the raw HTML instead of
+# building a tree.
+# Every <a> tag's href value, double-, single- or unquoted (group 1, 2 or 3).
+# The negated classes stay inside the tag; (?<![\w-]) keeps attributes such
+# as data-href from matching.
+A_HREF_RE = re.compile(
+    r"""<a\s[^>]*?(?<![\w-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+# An href naming an artwork detail page; captures the path without trailing
+# slash, query or fragment
+ART_PATH_RE = re.compile(r"^(/artwork/\d+)/?(?:[?#].*)?$")
+
+# Precompiled label patterns for _find_text_after_label, keyed by label text
+LABEL_REGEXES = {
+    'Location:': re.compile(r"^Location:\s*", re.IGNORECASE),
+    'Website:': re.compile(r"^Website:\s*", re.IGNORECASE),
+    'Description:': re.compile(r"^Description:\s*", re.IGNORECASE),
+}
+
+# Same labels, matched against the start of an individual (unstripped) text node
+LABEL_NODE_REGEXES = {
+    label: re.compile(rf"^\s*{re.escape(label)}", re.IGNORECASE) for label in LABEL_REGEXES
+}
+
+# Labels whose text nodes are gathered in a single pass over the soup
+INDEXED_LABELS = ('website', 'location', 'description', 'artwork')
+COMBINED_LABEL_RE = re.compile(rf"^\s*({'|'.join(INDEXED_LABELS)})\s*:?", re.IGNORECASE)
+
+# Leading "Description:" label, stripped from a container's text
+DESCRIPTION_LABEL_RE = re.compile(r"^\s*Description\s*:?\s*", re.IGNORECASE)
+
+# A sibling starting with another label ends the value being collected
+NEXT_LABEL_RE = re.compile(r"^(Website|Location|Description|Artwork)\s*:?", re.IGNORECASE)
+
+# Labels looked up on the lxml tree. Matching text nodes is much cheaper than
+# evaluating normalize-space(text()) on every element, so one //text() pass
+# finds all of them at once.
+LXML_LABELS = ('Location:', 'Description')
+LXML_SCAN_XPATH = "//text()[" + " or ".join(
+    f"starts-with(normalize-space(.), '{label}')" for label in LXML_LABELS
+) + "]"
+
 
 def extract_art_links_from_index(html_content: str, base_url: str = "https://directory.burningman.org") -> List[str]:
     """
@@ -26,52 +76,62 @@ def extract_art_links_from_index(html_content: str, base_url: str = "https://dir
     Returns:
         List of absolute artwork detail page URLs
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-
     art_links: List[str] = []
 
-    # Find anchors linking to /artwork/<id>/
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        # Accept both with and without trailing slash and optional query string
-        if re.search(r"^/artwork/\d+/?(?:[?#].*)?$", href):
-            # Normalize and build absolute URL
-            # Remove any query/fragment for canonical detail URL
-            canonical = re.sub(r"[?#].*$", "", href)
-            if not canonical.endswith('/'):
-                canonical += '/'
-            # Ensure absolute
-            if canonical.startswith('http'):
-                abs_url = canonical
-            else:
-                abs_url = base_url.rstrip('/') + canonical
-
-            art_links.append(abs_url)
+    # Find links to /artwork/<id>/ and build canonical absolute URLs
+    base = base_url.rstrip('/')
+    for m in A_HREF_RE.finditer(html_content):
+        path = ART_PATH_RE.match(m.group(m.lastindex))
+        if path:
+            art_links.append(f"{base}{path.group(1)}/")
 
     # De-duplicate while preserving order
-    seen = set()
-    unique_links: List[str] = []
-    for url in art_links:
-        if url not in seen:
-            seen.add(url)
-            unique_links.append(url)
+    return list(dict.fromkeys(art_links))
+
+
+def _head_text(node) -> str:
+    """First non-empty text of a node, without walking the rest of its subtree."""
+    if isinstance(node, Tag):
+        return next(node.stripped_strings, '')
+    return str(node).strip()
+
 
-    return unique_links
+def _head_text_lxml(el) -> str:
+    """First non-empty text of an lxml element, without walking the rest of its subtree."""
+    return next((t.strip() for t in el.itertext() if t.strip()), '')
 
 
-def _find_text_after_label(soup: BeautifulSoup, label_text: str) -> str:
+def _index_label_nodes(soup: BeautifulSoup) -> Dict[str, List[NavigableString]]:
+    """Collect every text node starting with a known label in one traversal, keyed by lowercased label."""
+    label_nodes: Dict[str, List[NavigableString]] = {}
+    for node in soup.find_all(string=COMBINED_LABEL_RE):
+        key = COMBINED_LABEL_RE.match(node).group(1).lower()
+        label_nodes.setdefault(key, []).append(node)
+    return label_nodes
+
+
+def _label_text_nodes(soup: BeautifulSoup, label_nodes, label_text: str, pattern) -> List[NavigableString]:
+    """Text nodes matching `pattern` in document order, served from the label index when it covers the label."""
+    key = label_text.rstrip(':').strip().lower()
+    if label_nodes is not None and key in INDEXED_LABELS:
+        return [node for node in label_nodes.get(key, ()) if pattern.search(node)]
+    return soup.find_all(string=pattern)
+
+
+def _find_text_after_label(soup: BeautifulSoup, label_text: str, label_nodes=None) -> str:
     """
     Find text value that follows a given label (e.g., "Location:").
 
     This function searches for any element whose text contains the label
     (case-insensitive), then returns the text of the nearest following sibling
-    or the remaining text in that container after the label.
+    or the remaining text in that container after the label. Pass the result
+    of _index_label_nodes as `label_nodes` to avoid rescanning the soup.
     """
     # Case-insensitive match for label (with optional trailing whitespace)
-    label_regex = re.compile(rf"^{re.escape(label_text)}\s*", re.IGNORECASE)
+    label_regex = LABEL_REGEXES.get(label_text) or re.compile(rf"^{re.escape(label_text)}\s*", re.IGNORECASE)
 
     # Strategy 1: Direct text node that starts with label
-    for text_node in soup.find_all(string=label_regex):
+    for text_node in _label_text_nodes(soup, label_nodes, label_text, label_regex):
         # Try to extract the tail (text after the label) on the same node
         full_text = text_node.strip()
         value = label_regex.sub("", full_text).strip()
@@ -83,22 +143,35 @@ def _find_text_after_label(soup: BeautifulSoup, label_text: str) -> str:
         # Gather text from following siblings within the same container
         collected: List[str] = []
         for sib in parent.next_siblings:
-            # Stop if we encounter another labeled section
-            sib_text = getattr(sib, 'get_text', lambda **_: str(sib))().strip()
-            if re.match(r"^(Website|Location|Description|Artwork)\s*:?", sib_text, re.IGNORECASE):
+            # Stop if we encounter another labeled section; probing only the
+            # first text node avoids walking every sibling's full subtree
+            if NEXT_LABEL_RE.match(_head_text(sib)):
                 break
+            sib_text = getattr(sib, 'get_text', lambda **_: str(sib))().strip()
             if sib_text:
                 collected.append(sib_text)
         if collected:
             return " ".join(collected).strip()
 
-    # Strategy 2: Find an element that contains the label and then
-    # look for a following sibling element's text
-    container = soup.find(lambda tag: tag.get_text(strip=True).lower().startswith(label_text.lower()))
+    # Strategy 2: Find the text node that starts with the label and use its
+    # enclosing element as the container, then look for a following sibling
+    # element's text. Matching text nodes avoids materializing every tag's text.
+    label_node_regex = LABEL_NODE_REGEXES.get(label_text) or re.compile(rf"^\s*{re.escape(label_text)}", re.IGNORECASE)
+    label_node = next(iter(_label_text_nodes(soup, label_nodes, label_text, label_node_regex)), None)
+    container = label_node.find_parent() if label_node else None
+    if container:
+        # Climb to the outermost element whose text still begins with the label
+        label_head = label_node.strip()
+        while (
+            container.parent is not None
+            and container.parent.name != '[document]'
+            and next(container.parent.stripped_strings, None) == label_head
+        ):
+            container = container.parent
     if container:
         # Remove the label from the container's text
         container_text = container.get_text(" ", strip=True)
-        value = re.sub(label_regex, "", container_text).strip()
+        value = label_regex.sub("", container_text).strip()
         if value:
             return value
 
@@ -110,6 +183,113 @@ def _find_text_after_label(soup: BeautifulSoup, label_text: str) -> str:
     return ""
 
 
+def _parse_lxml_tree(html_content: str):
+    """Parse HTML into an lxml element tree, or return None if lxml is unavailable."""
+    if lxml_html is None or not html_content.strip():
+        return None
+    try:
+        return lxml_html.fromstring(html_content)
+    except (ValueError, lxml_html.etree.ParserError):
+        return None
+
+
+def _scan_lxml_tree(tree) -> Dict[str, list]:
+    """
+    Find the elements whose first text node starts with each of LXML_LABELS.
+
+    Equivalent to one `//*[starts-with(normalize-space(text()), label)]` query
+    per label, in a single traversal. A label hit in a tail can't be placed in
+    element order cheaply, so that label is left out and looked up directly.
+    """
+    if tree is None:
+        return {}
+    label_els: Dict[str, list] = {label: [] for label in LXML_LABELS}
+    for text in tree.xpath(LXML_SCAN_XPATH):
+        label = next(label for label in LXML_LABELS if text.lstrip(' \t\r\n').startswith(label))
+        if text.is_tail:
+            label_els.pop(label, None)
+            continue
+        if label in label_els:
+            label_els[label].append(text.getparent())
+    return label_els
+
+
+def _labelled_elements_lxml(tree, label_els, label_text: str) -> list:
+    """Elements whose first text node starts with label_text, from the scan when it covers the label."""
+    if label_els is not None and label_text in label_els:
+        return label_els[label_text]
+    return tree.xpath(f"//*[starts-with(normalize-space(text()), '{label_text}')]")
+
+
+def _find_text_after_label_lxml(tree, label_text: str, label_els=None) -> str:
+    """
+    Fast path for _find_text_after_label using an lxml XPath query.
+
+    The traversal runs in C. Returns an empty string on a miss so callers can
+    fall back to the BeautifulSoup strategies.
+    """
+    if tree is None:
+        return ""
+    label_regex = LABEL_REGEXES.get(label_text) or re.compile(rf"^{re.escape(label_text)}\s*", re.IGNORECASE)
+
+    for el in _labelled_elements_lxml(tree, label_els, label_text):
+        # The label's own text node may carry the value, e.g. <p>Location: 9:00 &amp; C</p>
+        own_text = (el.text or "").strip()
+        if not label_regex.match(own_text):
+            continue
+        value = label_regex.sub("", own_text).strip()
+        if value:
+            return value
+
+        # Else gather the tail and following siblings until another label
+        collected: List[str] = []
+        if el.tail and el.tail.strip():
+            collected.append(el.tail.strip())
+        for sib in el.itersiblings():
+            if NEXT_LABEL_RE.match(_head_text_lxml(sib)):
+                break
+            sib_text = sib.text_content().strip()
+            if sib_text:
+                collected.append(sib_text)
+            if sib.tail and sib.tail.strip():
+                collected.append(sib.tail.strip())
+        if collected:
+            return " ".join(collected).strip()
+
+    return ""
+
+
+def _element_text(el) -> str:
+    """lxml equivalent of BeautifulSoup's get_text(" ", strip=True)."""
+    return " ".join(t.strip() for t in el.itertext() if t.strip())
+
+
+def _extract_heading_name_lxml(tree, prefix: str) -> str:
+    """Return the first non-empty h1 (then h2) text with an optional "<prefix>" removed."""
+    if tree is None:
+        return ""
+    for tag_name in ('h1', 'h2'):
+        for h in tree.iter(tag_name):
+            text = _element_text(h)
+            if text:
+                if text.lower().startswith(prefix):
+                    return text.split(':', 1)[1].strip()
+                return text
+    return ""
+
+
+def _find_description_lxml(tree, label_els=None) -> str:
+    """Return the block following the Description label, or the label container's remaining text."""
+    if tree is None:
+        return ""
+    for el in _labelled_elements_lxml(tree, label_els, 'Description'):
+        next_block = next((sib for sib in el.itersiblings() if isinstance(sib.tag, str)), None)
+        if next_block is not None:
+            return _element_text(next_block)
+        return DESCRIPTION_LABEL_RE.sub("", _element_text(el))
+    return ""
+
+
 def extract_art_data(html_content: str, detail_url: str) -> Dict[str, str]:
     """
     Extract artwork data from an artwork detail page.
@@ -121,51 +301,67 @@ def extract_art_data(html_content: str, detail_url: str) -> Dict[str, str]:
     Returns:
         Dictionary with keys: name, location, description
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Fast path: a well-labelled page is fully answered from the lxml tree
+    tree = _parse_lxml_tree(html_content)
+    label_els = _scan_lxml_tree(tree)
+    name = _extract_heading_name_lxml(tree, 'artwork:')
+    location = _find_text_after_label_lxml(tree, "Location:", label_els)
+    description = _find_description_lxml(tree, label_els)
+    if name and location and description:
+        return {
+            "name": name,
+            "location": location,
+            "description": description,
+        }
+
+    # Fallback: resilient BeautifulSoup strategies for the fields still missing
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    label_nodes = _index_label_nodes(soup)
 
     # Name: prefer heading that starts with "Artwork:"; otherwise, first h1/h2
-    name = ""
-    for tag_name in ['h1', 'h2']:
-        for h in soup.find_all(tag_name):
-            text = h.get_text(" ", strip=True)
-            if text:
-                # Remove "Artwork:" prefix if present
-                if text.lower().startswith('artwork:'):
-                    candidate = text.split(':', 1)[1].strip()
-                else:
-                    candidate = text
-                name = candidate
+    if not name:
+        for tag_name in ['h1', 'h2']:
+            for h in soup.find_all(tag_name):
+                text = h.get_text(" ", strip=True)
+                if text:
+                    # Remove "Artwork:" prefix if present
+                    if text.lower().startswith('artwork:'):
+                        candidate = text.split(':', 1)[1].strip()
+                    else:
+                        candidate = text
+                    name = candidate
+                    break
+            if name:
                 break
-        if name:
-            break
 
     if not name:
         # Fallback: search for direct text pattern
-        match = soup.find(string=re.compile(r"^\s*Artwork:\s*(.+)$", re.IGNORECASE))
+        match = next(iter(_label_text_nodes(soup, label_nodes, "Artwork:", re.compile(r"^\s*Artwork:\s*(.+)$", re.IGNORECASE))), None)
         if match:
             name = re.sub(r"^\s*Artwork:\s*", "", str(match)).strip()
 
     # Location
-    location = _find_text_after_label(soup, "Location:")
+    if not location:
+        location = _find_text_after_label(soup, "Location:", label_nodes)
 
     # Description: attempt to capture text after a Description label
-    description = ""
-    desc_label = soup.find(string=re.compile(r"^\s*Description\s*:?", re.IGNORECASE))
-    if desc_label:
-        collected: List[str] = []
-        parent = desc_label.parent
-        # Prefer the next sibling block's text
-        next_block = parent.find_next_sibling()
-        if next_block:
-            text = next_block.get_text(" ", strip=True)
-            collected.append(text)
-        else:
-            # Fallback: remaining text in the same container after the label
-            container_text = parent.get_text(" ", strip=True)
-            container_text = re.sub(r"^\s*Description\s*:?\s*", "", container_text, flags=re.IGNORECASE)
-            if container_text:
-                collected.append(container_text)
-        description = " ".join([t for t in collected if t]).strip()
+    if not description:
+        desc_label = next(iter(label_nodes.get('description', ())), None)
+        if desc_label:
+            collected: List[str] = []
+            parent = desc_label.parent
+            # Prefer the next sibling block's text
+            next_block = parent.find_next_sibling()
+            if next_block:
+                text = next_block.get_text(" ", strip=True)
+                collected.append(text)
+            else:
+                # Fallback: remaining text in the same container after the label
+                container_text = parent.get_text(" ", strip=True)
+                container_text = DESCRIPTION_LABEL_RE.sub("", container_text)
+                if container_text:
+                    collected.append(container_text)
+            description = " ".join([t for t in collected if t]).strip()
 
     if not description:
         # Fallback: try meta description if available
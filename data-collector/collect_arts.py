@@ -6,18 +6,17 @@ This script scrapes the public Playa Info Artwork Directory to collect
 art name, location, and description, saving the result to `arts.json` by default.
 
 Usage:
-    python collect_arts.py [--output arts.json] [--max-pages N]
+    python collect_arts.py [--output arts.json] [--max-pages N] [--no-cache]
 """
 
 import argparse
-import json
-import time
+import re
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
-
-import requests
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 
 from art_parser import extract_art_links_from_index, extract_art_data
+from fetch import RateLimiter, create_session, fetch_pages, fetch_sitemap_links, in_index_order
+from jsonio import JsonArrayWriter
 from geo import clock_and_distance_to_latlon
 
 
@@ -25,87 +24,89 @@ BASE_DIR_URL = "https://directory.burningman.org/artwork/?page={page}"
 START_PAGE = 1
 END_PAGE = 8
 
-REQUEST_DELAY = 1.0
+# Lists every detail page, so one request can replace the index page walk
+SITEMAP_URL = "https://directory.burningman.org/sitemap.xml"
+ART_PATH_RE = re.compile(r"^(/artwork/\d+)/?$")
+
+REQUEST_DELAY = 1.0  # Minimum spacing between request starts across workers
 REQUEST_TIMEOUT = 30
 
+# Artwork location like "5:30 1710', Open Playa": <HH:MM> <feet>'
+LOCATION_PATTERN = re.compile(r"^\s*([0-1]?\d:[0-5]\d)\s+([0-9]{2,5})'?\b")
+
 
 class ArtCollector:
-    def __init__(self, output_file: str = "arts.json", max_pages: int = None):
+    def __init__(self, output_file: str = "arts.json", max_pages: int = None, use_cache: bool = True):
         self.output_file = output_file
         self.max_pages = max_pages
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BurningMan-EventGuide-ArtCollector/1.0'
-        })
+        self.session = create_session('BurningMan-EventGuide-ArtCollector/1.0', use_cache=use_cache)
+        # Shared across worker threads so the overall request rate stays polite
+        self.limiter = RateLimiter(REQUEST_DELAY)
 
     def collect_all_detail_links(self) -> List[str]:
-        links: List[str] = []
+        # --max-pages asks for a small test run, so it keeps the paginated index
+        if not self.max_pages:
+            print(f"Collecting artwork links from {SITEMAP_URL}...")
+            links = fetch_sitemap_links(self.session, SITEMAP_URL, ART_PATH_RE, self.limiter, REQUEST_TIMEOUT)
+            if links:
+                print(f"\nTotal unique artwork links: {len(links)}")
+                return links
+            print("  Sitemap unavailable or empty; falling back to index pages")
+
         print("Collecting artwork links from index pages...")
-        total_pages = END_PAGE - START_PAGE + 1
-
-        for i, page in enumerate(range(START_PAGE, END_PAGE + 1), 1):
-            if self.max_pages and i > self.max_pages:
-                print(f"Reached max pages limit ({self.max_pages})")
-                break
-
-            url = BASE_DIR_URL.format(page=page)
-            print(f"  Processing index {i}/{total_pages}: {url}")
-            try:
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                page_links = extract_art_links_from_index(response.text)
-                print(f"    Found {len(page_links)} artwork links")
-                links.extend(page_links)
-            except requests.RequestException as e:
-                print(f"    Error fetching {url}: {e}")
-
-            if i < total_pages:
-                time.sleep(REQUEST_DELAY)
+        pages = list(range(START_PAGE, END_PAGE + 1))
+        total_pages = len(pages)
+        if self.max_pages and self.max_pages < total_pages:
+            print(f"Limiting to max pages ({self.max_pages})")
+            pages = pages[: self.max_pages]
+        urls = [BASE_DIR_URL.format(page=page) for page in pages]
+
+        links_by_page: Dict[int, List[str]] = {}
+        for idx, url, html, error in fetch_pages(self.session, urls, self.limiter, REQUEST_TIMEOUT):
+            print(f"  Processed index {idx + 1}/{total_pages}: {url}")
+            if error is not None:
+                print(f"    Error fetching {url}: {error}")
+                continue
+            page_links = extract_art_links_from_index(html)
+            print(f"    Found {len(page_links)} artwork links")
+            links_by_page[idx] = page_links
+
+        # Pages complete out of order; merge them back in page order
+        links = [link for idx in sorted(links_by_page) for link in links_by_page[idx]]
 
         # De-duplicate while preserving order
-        seen: Set[str] = set()
-        unique_links: List[str] = []
-        for link in links:
-            if link not in seen:
-                seen.add(link)
-                unique_links.append(link)
+        unique_links = list(dict.fromkeys(links))
 
         print(f"\nTotal unique artwork links: {len(unique_links)}")
         return unique_links
 
-    def collect_art_details(self, detail_links: List[str]) -> List[Dict]:
-        arts: List[Dict] = []
+    def collect_art_details(self, detail_links: List[str]) -> Iterator[Dict]:
+        """Yield artwork entries in detail-link order as their pages arrive."""
         total = len(detail_links)
         print(f"\nCollecting details for {total} artworks...")
 
-        for idx, link in enumerate(detail_links, 1):
-            print(f"  Processing {idx}/{total}: {link}")
-            try:
-                response = self.session.get(link, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                data = extract_art_data(response.text, link)
-                name = data.get("name", "")
-                location = data.get("location", "")
-                description = data.get("description", "")
-
-                lat, lon = self._maybe_compute_latlon_from_location(location)
-                art_entry: Dict[str, Optional[str]] = {
-                    "name": name,
-                    "location": location,
-                    "description": description,
-                }
-                if lat is not None and lon is not None:
-                    art_entry["latitude"] = lat
-                    art_entry["longitude"] = lon
-
-                arts.append(art_entry)
-            except requests.RequestException as e:
-                print(f"    Error fetching {link}: {e}")
-
-            time.sleep(REQUEST_DELAY)
-
-        print(f"\nSuccessfully collected {len(arts)} artworks")
-        return arts
+        pages = fetch_pages(self.session, detail_links, self.limiter, REQUEST_TIMEOUT)
+        for idx, link, html, error in in_index_order(pages):
+            print(f"  Processed {idx + 1}/{total}: {link}")
+            if error is not None:
+                print(f"    Error fetching {link}: {error}")
+                continue
+            data = extract_art_data(html, link)
+            name = data.get("name", "")
+            location = data.get("location", "")
+            description = data.get("description", "")
+
+            lat, lon = self._maybe_compute_latlon_from_location(location)
+            art_entry: Dict[str, Optional[str]] = {
+                "name": name,
+                "location": location,
+                "description": description,
+            }
+            if lat is not None and lon is not None:
+                art_entry["latitude"] = lat
+                art_entry["longitude"] = lon
+
+            yield art_entry
 
     @staticmethod
     def _maybe_compute_latlon_from_location(location: str) -> Tuple[Optional[float], Optional[float]]:
@@ -114,11 +115,10 @@ class ArtCollector:
 
         Returns (None, None) if parsing fails.
         """
-        import re
         if not location:
             return (None, None)
         # Pattern: <HH:MM> <feet>' optionally followed by comma and text
-        m = re.match(r"^\s*([0-1]?\d:[0-5]\d)\s+([0-9]{2,5})'?\b", location)
+        m = LOCATION_PATTERN.match(location)
         if not m:
             return (None, None)
         clock = m.group(1)
@@ -133,16 +133,22 @@ class ArtCollector:
         except Exception:
             return (None, None)
 
-    def save(self, arts: List[Dict]) -> None:
-        print(f"\nSaving {len(arts)} artworks to {self.output_file}...")
+    def save(self, arts: Iterable[Dict]) -> int:
+        """Write artworks to the output file as they are produced; returns how many were saved."""
+        print(f"\nStreaming artworks to {self.output_file}...")
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(arts, f, indent=2, ensure_ascii=False)
+            with JsonArrayWriter(self.output_file) as writer:
+                for entry in arts:
+                    writer.write(entry)
+        except OSError as e:
+            print(f"Error saving file: {e}")
+            return 0
 
+        if writer.count:
+            print(f"\nSuccessfully collected {writer.count} artworks")
             file_size = Path(self.output_file).stat().st_size
             print(f"✓ Data saved. File size: {file_size / (1024*1024):.2f} MB")
-        except Exception as e:
-            print(f"Error saving file: {e}")
+        return writer.count
 
     def run(self) -> None:
         print("=== Burning Man Artwork Data Collector ===")
@@ -156,12 +162,12 @@ class ArtCollector:
             print("No artwork links found. Exiting.")
             return
 
-        arts = self.collect_art_details(links)
-        if not arts:
+        # Entries are written as they are collected, so a long run never holds
+        # the whole directory in memory and an interrupt keeps what was fetched
+        saved = self.save(self.collect_art_details(links))
+        if not saved:
             print("No artwork details collected. Exiting.")
             return
-
-        self.save(arts)
         print("\n=== Collection Complete ===")
 
 
@@ -179,10 +185,15 @@ def main():
         type=int,
         help="Limit number of index pages to scan (for testing)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk HTTP cache and download every page again",
+    )
 
     args = parser.parse_args()
 
-    collector = ArtCollector(output_file=args.output, max_pages=args.max_pages)
+    collector = ArtCollector(output_file=args.output, max_pages=args.max_pages, use_cache=not args.no_cache)
     try:
         collector.run()
     except KeyboardInterrupt:
@@ -7,19 +7,18 @@ camp name, website, location, and description, saving the result to
 `camps.json` by default.
 
 Usage:
-    python collect_camps.py [--output camps.json] [--max-pages N]
+    python collect_camps.py [--output camps.json] [--max-pages N] [--no-cache]
 """
 
 import argparse
-import json
 import re
-import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-
-import requests
+from typing import Iterable, Iterator, List, Dict, Optional
 
 from camp_parser import extract_camp_links_from_index, extract_camp_data
+from fetch import RateLimiter, create_session, fetch_pages, fetch_sitemap_links, in_index_order
+from jsonio import JsonArrayWriter
 from geo import normalized_location_to_latlon
 
 
@@ -27,11 +26,25 @@ BASE_DIR_URL = "https://directory.burningman.org/camps/?page={page}"
 START_PAGE = 1
 END_PAGE = 30
 
-REQUEST_DELAY = 1.0
+# Lists every detail page, so one request can replace the index page walk
+SITEMAP_URL = "https://directory.burningman.org/sitemap.xml"
+CAMP_PATH_RE = re.compile(r"^(/camps/\d+)/?$")
+
+REQUEST_DELAY = 1.0  # Minimum spacing between request starts across workers
 REQUEST_TIMEOUT = 30
 
 
 TIME_PATTERN = re.compile(r"\b((?:[0-1]?\d|2[0-3]):[0-5]\d)\b")
+PAREN_PATTERN = re.compile(r"\s*\([^)]*\)")
+COMMA_TAIL_PATTERN = re.compile(r",.*$")
+# Both of the above in one pass; only equivalent when there is no newline,
+# because "$" also matches before a final newline
+CLEANUP_PATTERN = re.compile(r"\s*\([^)]*\)|,.*$")
+ESPLANADE_PATTERN = re.compile(r"\bEsplanade\b", re.IGNORECASE)
+RING_LETTER_PATTERN = re.compile(r"\b([A-Ka-k])\b")
+RING_PLAZA_PATTERN = re.compile(r"\b([A-Ka-k])\s*(?:Plaza|Plz)\b", re.IGNORECASE)
+WORD_PATTERN = re.compile(r"\b([A-Za-z][A-Za-z\-']*)\b")
+RING_LETTERS = frozenset("ABCDEFGHIJK")
 
 
 def _extract_clock(text: str) -> Optional[str]:
@@ -47,31 +60,38 @@ def _extract_ring(text: str) -> Optional[str]:
     if not text:
         return None
     s = text.strip()
-    if re.search(r"\bEsplanade\b", s, flags=re.IGNORECASE):
+    # Cheap substring test before paying for the word-boundary regex
+    if 'esplanade' in s.lower() and ESPLANADE_PATTERN.search(s):
         return "Esplanade"
-    m = re.search(r"\b([A-Ka-k])\b", s)
+    m = RING_LETTER_PATTERN.search(s)
     if m:
         return m.group(1).upper()
-    m = re.search(r"\b([A-Ka-k])\s*(?:Plaza|Plz)\b", s, flags=re.IGNORECASE)
+    m = RING_PLAZA_PATTERN.search(s)
     if m:
         return m.group(1).upper()
-    for word in re.findall(r"\b([A-Za-z][A-Za-z\-']*)\b", s):
+    # Named street: scan words lazily and stop at the first usable initial
+    for m in WORD_PATTERN.finditer(s):
+        word = m.group(1)
         if word.lower() == 'esplanade':
             return 'Esplanade'
         first = word[0].upper()
-        if first in "ABCDEFGHIJK":
+        if first in RING_LETTERS:
             return first
     return None
 
 
+# Pure and memoized: neighbouring camps often list the same location
+@lru_cache(maxsize=4096)
 def normalize_location(raw_location: str) -> str:
     if not raw_location:
         return ""
-    s = re.sub(r"\s*\([^)]*\)", "", raw_location)
-    s = re.sub(r",.*$", "", s)
+    if '\n' in raw_location:
+        s = COMMA_TAIL_PATTERN.sub("", PAREN_PATTERN.sub("", raw_location))
+    else:
+        s = CLEANUP_PATTERN.sub("", raw_location)
     s = s.replace('@', '&')
-    s = re.sub(r"\s*&\s*", " & ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    # Pad every '&' with single spaces and collapse whitespace without regex
+    s = " ".join(" & ".join(s.split('&')).split())
     ring = _extract_ring(s)
     clock = _extract_clock(s)
     if ring and clock:
@@ -90,90 +110,91 @@ def normalize_location(raw_location: str) -> str:
 
 
 class CampCollector:
-    def __init__(self, output_file: str = "camps.json", max_pages: int = None):
+    def __init__(self, output_file: str = "camps.json", max_pages: int = None, use_cache: bool = True):
         self.output_file = output_file
         self.max_pages = max_pages
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BurningMan-EventGuide-CampCollector/1.0'
-        })
+        self.session = create_session('BurningMan-EventGuide-CampCollector/1.0', use_cache=use_cache)
+        # Shared across worker threads so the overall request rate stays polite
+        self.limiter = RateLimiter(REQUEST_DELAY)
 
     def collect_all_detail_links(self) -> List[str]:
-        links: List[str] = []
-        print("Collecting camp links from index pages...")
-        total_pages = END_PAGE - START_PAGE + 1
-
-        for i, page in enumerate(range(START_PAGE, END_PAGE + 1), 1):
-            if self.max_pages and i > self.max_pages:
-                print(f"Reached max pages limit ({self.max_pages})")
-                break
-
-            url = BASE_DIR_URL.format(page=page)
-            print(f"  Processing index {i}/{total_pages}: {url}")
-            try:
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                page_links = extract_camp_links_from_index(response.text)
-                print(f"    Found {len(page_links)} camp links")
-                links.extend(page_links)
-            except requests.RequestException as e:
-                print(f"    Error fetching {url}: {e}")
+        # --max-pages asks for a small test run, so it keeps the paginated index
+        if not self.max_pages:
+            print(f"Collecting camp links from {SITEMAP_URL}...")
+            links = fetch_sitemap_links(self.session, SITEMAP_URL, CAMP_PATH_RE, self.limiter, REQUEST_TIMEOUT)
+            if links:
+                print(f"\nTotal unique camp links: {len(links)}")
+                return links
+            print("  Sitemap unavailable or empty; falling back to index pages")
 
-            if i < total_pages:
-                time.sleep(REQUEST_DELAY)
+        print("Collecting camp links from index pages...")
+        pages = list(range(START_PAGE, END_PAGE + 1))
+        total_pages = len(pages)
+        if self.max_pages and self.max_pages < total_pages:
+            print(f"Limiting to max pages ({self.max_pages})")
+            pages = pages[: self.max_pages]
+        urls = [BASE_DIR_URL.format(page=page) for page in pages]
+
+        links_by_page: Dict[int, List[str]] = {}
+        for idx, url, html, error in fetch_pages(self.session, urls, self.limiter, REQUEST_TIMEOUT):
+            print(f"  Processed index {idx + 1}/{total_pages}: {url}")
+            if error is not None:
+                print(f"    Error fetching {url}: {error}")
+                continue
+            page_links = extract_camp_links_from_index(html)
+            print(f"    Found {len(page_links)} camp links")
+            links_by_page[idx] = page_links
+
+        # Pages complete out of order; merge them back in page order
+        links = [link for idx in sorted(links_by_page) for link in links_by_page[idx]]
 
         # De-duplicate while preserving order
-        seen: Set[str] = set()
-        unique_links: List[str] = []
-        for link in links:
-            if link not in seen:
-                seen.add(link)
-                unique_links.append(link)
+        unique_links = list(dict.fromkeys(links))
 
         print(f"\nTotal unique camp links: {len(unique_links)}")
         return unique_links
 
-    def collect_camp_details(self, detail_links: List[str]) -> List[Dict]:
-        camps: List[Dict] = []
+    def collect_camp_details(self, detail_links: List[str]) -> Iterator[Dict]:
+        """Yield camp entries in detail-link order as their pages arrive."""
         total = len(detail_links)
         print(f"\nCollecting details for {total} camps...")
 
-        for idx, link in enumerate(detail_links, 1):
-            print(f"  Processing {idx}/{total}: {link}")
+        pages = fetch_pages(self.session, detail_links, self.limiter, REQUEST_TIMEOUT)
+        for idx, link, html, error in in_index_order(pages):
+            print(f"  Processed {idx + 1}/{total}: {link}")
+            if error is not None:
+                print(f"    Error fetching {link}: {error}")
+                continue
+            data = extract_camp_data(html, link)
+            # Add normalized location
+            data["normalized_location"] = normalize_location(data.get("location", ""))
+            # Add approximate coordinates if normalization succeeded
             try:
-                response = self.session.get(link, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                data = extract_camp_data(response.text, link)
-                # Add normalized location
-                data["normalized_location"] = normalize_location(data.get("location", ""))
-                # Add approximate coordinates if normalization succeeded
-                try:
-                    if data["normalized_location"] and "&" in data["normalized_location"]:
-                        lat, lon = normalized_location_to_latlon(data["normalized_location"])
-                        data["latitude"] = lat
-                        data["longitude"] = lon
-                except Exception:
-                    # Skip coordinate assignment on parsing errors
-                    pass
-                camps.append(data)
-            except requests.RequestException as e:
-                print(f"    Error fetching {link}: {e}")
-
-            time.sleep(REQUEST_DELAY)
-
-        print(f"\nSuccessfully collected {len(camps)} camps")
-        return camps
-
-    def save(self, camps: List[Dict]) -> None:
-        print(f"\nSaving {len(camps)} camps to {self.output_file}...")
+                if data["normalized_location"] and "&" in data["normalized_location"]:
+                    lat, lon = normalized_location_to_latlon(data["normalized_location"])
+                    data["latitude"] = lat
+                    data["longitude"] = lon
+            except Exception:
+                # Skip coordinate assignment on parsing errors
+                pass
+            yield data
+
+    def save(self, camps: Iterable[Dict]) -> int:
+        """Write camps to the output file as they are produced; returns how many were saved."""
+        print(f"\nStreaming camps to {self.output_file}...")
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(camps, f, indent=2, ensure_ascii=False)
+            with JsonArrayWriter(self.output_file) as writer:
+                for entry in camps:
+                    writer.write(entry)
+        except OSError as e:
+            print(f"Error saving file: {e}")
+            return 0
 
+        if writer.count:
+            print(f"\nSuccessfully collected {writer.count} camps")
             file_size = Path(self.output_file).stat().st_size
             print(f"✓ Data saved. File size: {file_size / (1024*1024):.2f} MB")
-        except Exception as e:
-            print(f"Error saving file: {e}")
+        return writer.count
 
     def run(self) -> None:
         print("=== Burning Man Camps Data Collector ===")
@@ -187,12 +208,12 @@ class CampCollector:
             print("No camp links found. Exiting.")
             return
 
-        camps = self.collect_camp_details(links)
-        if not camps:
+        # Entries are written as they are collected, so a long run never holds
+        # the whole directory in memory and an interrupt keeps what was fetched
+        saved = self.save(self.collect_camp_details(links))
+        if not saved:
             print("No camp details collected. Exiting.")
             return
-
-        self.save(camps)
         print("\n=== Collection Complete ===")
 
 
@@ -210,10 +231,15 @@ def main():
         type=int,
         help="Limit number of index pages to scan (for testing)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk HTTP cache and download every page again",
+    )
 
     args = parser.parse_args()
 
-    collector = CampCollector(output_file=args.output, max_pages=args.max_pages)
+    collector = CampCollector(output_file=args.output, max_pages=args.max_pages, use_cache=not args.no_cache)
     try:
         collector.run()
     except KeyboardInterrupt:
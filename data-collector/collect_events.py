@@ -6,17 +6,17 @@ This script collects event data from the Burning Man Playa Events website
 and saves it to a structured JSON file.
 
 Usage:
-    python collect_events.py [--output events.json] [--max-events N]
+    python collect_events.py [--output events.json] [--max-events N] [--no-cache]
 """
 
 import argparse
-import json
 import re
-import requests
-import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Set, Optional, Tuple
 from event_parser import extract_event_ids_from_index, extract_event_data
+from fetch import RateLimiter, create_session, fetch_pages, in_index_order
+from jsonio import JsonArrayWriter, read_json
 
 # Configuration
 BASE_URL = "https://playaevents.burningman.org/2025"
@@ -31,10 +31,15 @@ INDEX_URLS = [
     f"{BASE_URL}/playa_events/08",
 ]
 
-REQUEST_DELAY = 1.0  # Delay between requests to be respectful
+REQUEST_DELAY = 1.0  # Minimum spacing between request starts across workers
 REQUEST_TIMEOUT = 30  # Request timeout in seconds
 
+# Camp name normalization
+AND_WORD_PATTERN = re.compile(r"\band\b")
+NON_KEY_CHAR_PATTERN = re.compile(r"[^a-z0-9 &]")
 
+
+@lru_cache(maxsize=8192)
 def _normalize_camp_name(name: str) -> str:
     """Normalize camp names for robust matching.
 
@@ -45,30 +50,31 @@ def _normalize_camp_name(name: str) -> str:
     """
     if not name:
         return ""
-    s = name.lower().strip()
-    s = re.sub(r"\s+", " ", s)
-    # normalize textual ' and ' to ' & '
-    s = re.sub(r"\band\b", "&", s)
+    # strip and collapse whitespace (str.split matches the same whitespace as \s)
+    s = " ".join(name.lower().split())
+    # normalize textual ' and ' to ' & '; most names have no "and" at all
+    if "and" in s:
+        s = AND_WORD_PATTERN.sub("&", s)
     # keep letters, numbers, spaces, and '&'
-    s = re.sub(r"[^a-z0-9 &]", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = NON_KEY_CHAR_PATTERN.sub("", s)
+    return " ".join(s.split())
 
 
-def _load_camps_map(camps_file: Optional[str]) -> Dict[str, Dict]:
-    """Load camps.json and return a lookup by normalized camp name.
+def _load_camps_map(camps_file: Optional[str]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Load camps.json and return lookups by normalized camp name.
 
+    Returns (lookup, loose_lookup): the second is keyed by the normalized name
+    with spaces removed, keeping the first camp for each loose key.
     The value dict includes keys: name, normalized_location, latitude, longitude, location.
     """
     if not camps_file:
-        return {}
+        return {}, {}
     path = Path(camps_file)
     if not path.exists():
         print(f"Warning: camps file not found at {camps_file}; events will not be enriched.")
-        return {}
+        return {}, {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            camps = json.load(f)
+        camps = read_json(path)
         lookup: Dict[str, Dict] = {}
         for c in camps:
             name = c.get("name", "")
@@ -76,25 +82,30 @@ def _load_camps_map(camps_file: Optional[str]) -> Dict[str, Dict]:
             if not key:
                 continue
             lookup[key] = c
+        # Normalized keys hold single spaces only, so dropping them is enough
+        loose_lookup: Dict[str, Dict] = {}
+        for key, c in lookup.items():
+            loose_lookup.setdefault(key.replace(" ", ""), c)
         print(f"Loaded {len(lookup)} camps from {camps_file}")
-        return lookup
+        return lookup, loose_lookup
     except Exception as e:
         print(f"Warning: failed to read camps file {camps_file}: {e}")
-        return {}
+        return {}, {}
 
 
 class EventCollector:
     """Main event collector class."""
     
-    def __init__(self, output_file: str = "events.json", max_events: int = None, camps_file: Optional[str] = None):
+    def __init__(self, output_file: str = "events.json", max_events: int = None, camps_file: Optional[str] = None, use_cache: bool = True):
         self.output_file = output_file
         self.max_events = max_events
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BurningMan-EventGuide-DataCollector/1.0'
-        })
+        self.session = create_session('BurningMan-EventGuide-DataCollector/1.0', use_cache=use_cache)
         self.camps_file = camps_file
-        self.camps_by_name: Dict[str, Dict] = _load_camps_map(camps_file)
+        self.camps_by_name, self.camps_by_loose_name = _load_camps_map(camps_file)
+        # Resolved (location, latitude, longitude) per raw camp name; many events share a camp
+        self._enrich_cache: Dict[str, Tuple[str, Optional[float], Optional[float]]] = {}
+        # Shared across worker threads so the overall request rate stays polite
+        self.limiter = RateLimiter(REQUEST_DELAY)
         
     def collect_all_event_ids(self) -> Set[str]:
         """
@@ -107,125 +118,121 @@ class EventCollector:
         
         print("Collecting event IDs from index pages...")
         
-        for i, url in enumerate(INDEX_URLS, 1):
-            print(f"  Processing index {i}/{len(INDEX_URLS)}: {url}")
-            
-            try:
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                
-                event_ids = extract_event_ids_from_index(response.text)
-                all_event_ids.update(event_ids)
-                
-                print(f"    Found {len(event_ids)} events (total unique: {len(all_event_ids)})")
-                
-            except requests.RequestException as e:
-                print(f"    Error fetching {url}: {e}")
+        for idx, url, html, error in fetch_pages(self.session, INDEX_URLS, self.limiter, REQUEST_TIMEOUT):
+            print(f"  Processed index {idx + 1}/{len(INDEX_URLS)}: {url}")
+            if error is not None:
+                print(f"    Error fetching {url}: {error}")
                 continue
             
-            # Be respectful with delays
-            if i < len(INDEX_URLS):
-                time.sleep(REQUEST_DELAY)
+            event_ids = extract_event_ids_from_index(html)
+            all_event_ids.update(event_ids)
+            
+            print(f"    Found {len(event_ids)} events (total unique: {len(all_event_ids)})")
         
         print(f"\nTotal unique events found: {len(all_event_ids)}")
         return all_event_ids
     
-    def collect_event_data(self, event_ids: List[str]) -> List[Dict]:
+    def collect_event_data(self, event_ids: List[str]) -> Iterator[Dict]:
         """
         Collect detailed data for each event.
         
         Args:
             event_ids: List of event IDs to collect
             
-        Returns:
-            List of event data dictionaries
+        Yields:
+            Event data dictionaries in event ID order as their pages arrive
         """
-        events_data = []
         total_events = len(event_ids)
         
         print(f"\nCollecting detailed data for {total_events} events...")
         
-        for i, event_id in enumerate(event_ids, 1):
-            if self.max_events and i > self.max_events:
-                print(f"\nReached maximum events limit ({self.max_events})")
-                break
-                
+        if self.max_events and self.max_events < total_events:
+            print(f"Limiting to maximum events ({self.max_events})")
+            event_ids = event_ids[: self.max_events]
+        
+        urls = [f"{BASE_URL}/playa_event/{event_id}/" for event_id in event_ids]
+        # Pages complete out of order; process them in event ID order
+        pages = fetch_pages(self.session, urls, self.limiter, REQUEST_TIMEOUT)
+        for idx, event_url, html, error in in_index_order(pages):
+            i = idx + 1
+            event_id = event_ids[idx]
             print(f"  Processing event {i}/{total_events}: {event_id}")
-            
-            try:
-                event_url = f"{BASE_URL}/playa_event/{event_id}/"
-                response = self.session.get(event_url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-                
-                event_data = extract_event_data(response.text, event_id)
-                # Enrich with camp location and coordinates, if available
-                camp_name = event_data.get("camp", "")
-                enriched = self._enrich_with_camp_location(event_data, camp_name)
-                events_data.append(enriched)
-                
-                # Show progress every 50 events
-                if i % 50 == 0:
-                    print(f"    Progress: {i}/{total_events} events processed")
-                
-            except requests.RequestException as e:
-                print(f"    Error fetching event {event_id}: {e}")
+            if error is not None:
+                print(f"    Error fetching event {event_id}: {error}")
                 continue
             
-            # Be respectful with delays
-            time.sleep(REQUEST_DELAY)
-        
-        print(f"\nSuccessfully collected data for {len(events_data)} events")
-        return events_data
+            event_data = extract_event_data(html, event_id)
+            # Enrich with camp location and coordinates, if available
+            camp_name = event_data.get("camp", "")
+            yield self._enrich_with_camp_location(event_data, camp_name)
+            
+            # Show progress every 50 events
+            if i % 50 == 0:
+                print(f"    Progress: {i}/{total_events} events processed")
 
     def _enrich_with_camp_location(self, event: Dict, camp_name: str) -> Dict:
-        """Return a copy of event with location/lat/lon enriched from camps map.
+        """Enrich event in place with location/lat/lon from camps map and return it.
 
         If no match or no normalized_location is available, set location to "n/a".
         """
-        # Work on a copy to avoid side-effects
-        e = dict(event)
+        # extract_event_data builds a fresh dict per page, so it is safe to modify.
         # If we don't have camps, mark for manual review
         if not self.camps_by_name:
-            if not e.get("location"):
-                e["location"] = "n/a"
-            return e
+            if not event.get("location"):
+                event["location"] = "n/a"
+            return event
+
+        resolved = self._enrich_cache.get(camp_name)
+        if resolved is None:
+            resolved = self._enrich_cache[camp_name] = self._resolve_camp_location(camp_name)
+        location, latitude, longitude = resolved
+        event["location"] = location
+        # Latitude/longitude are only set when the camp resolved with coordinates
+        if latitude is not None:
+            event["latitude"] = latitude
+            event["longitude"] = longitude
+        return event
 
+    def _resolve_camp_location(self, camp_name: str) -> Tuple[str, Optional[float], Optional[float]]:
+        """Look up (location, latitude, longitude) for a camp name; location is "n/a" when unresolved."""
         key = _normalize_camp_name(camp_name)
         camp = self.camps_by_name.get(key)
         if not camp:
             # Attempt a looser match by stripping spaces
-            loose_key = re.sub(r"\s+", "", key)
-            for k, v in self.camps_by_name.items():
-                if re.sub(r"\s+", "", k) == loose_key:
-                    camp = v
-                    break
+            camp = self.camps_by_loose_name.get(key.replace(" ", ""))
 
         if camp:
             norm_loc = camp.get("normalized_location") or ""
             if norm_loc:
-                e["location"] = norm_loc
                 if "latitude" in camp and "longitude" in camp and camp["latitude"] and camp["longitude"]:
-                    e["latitude"] = camp["latitude"]
-                    e["longitude"] = camp["longitude"]
-                return e
+                    return norm_loc, camp["latitude"], camp["longitude"]
+                return norm_loc, None, None
 
         # No usable camp location; set to n/a for manual review
-        e["location"] = "n/a"
-        # Do not set latitude/longitude when unresolved
-        return e
+        return "n/a", None, None
     
-    def save_events_data(self, events_data: List[Dict]) -> None:
+    def save_events_data(self, events_data: Iterable[Dict]) -> int:
         """
-        Save events data to JSON file.
+        Save events data to JSON file as it is produced.
         
         Args:
-            events_data: List of event data dictionaries
+            events_data: Event data dictionaries, typically the collect_event_data generator
+            
+        Returns:
+            Number of events saved
         """
-        print(f"\nSaving {len(events_data)} events to {self.output_file}...")
+        print(f"\nStreaming events to {self.output_file}...")
         
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(events_data, f, indent=2, ensure_ascii=False)
+            with JsonArrayWriter(self.output_file) as writer:
+                for event in events_data:
+                    writer.write(event)
+        except OSError as e:
+            print(f"Error saving file: {e}")
+            return 0
+        
+        if writer.count:
+            print(f"\nSuccessfully collected data for {writer.count} events")
             
             # Calculate file size
             file_size = Path(self.output_file).stat().st_size
@@ -234,10 +241,8 @@ class EventCollector:
             print(f"✓ Data saved successfully!")
             print(f"  File: {self.output_file}")
             print(f"  Size: {file_size_mb:.2f} MB")
-            print(f"  Events: {len(events_data)}")
-            
-        except Exception as e:
-            print(f"Error saving file: {e}")
+            print(f"  Events: {writer.count}")
+        return writer.count
     
     def run(self) -> None:
         """Run the complete data collection process."""
@@ -254,19 +259,17 @@ class EventCollector:
             print("No event IDs found. Exiting.")
             return
         
-        # Convert to sorted list for consistent processing
-        event_ids_list = sorted(list(event_ids))
+        # Sort numerically (so "2" comes before "10") for consistent processing
+        event_ids_list = sorted(event_ids, key=int)
         
-        # Step 2: Collect detailed event data
-        events_data = self.collect_event_data(event_ids_list)
+        # Steps 2 and 3: Collect detailed event data, writing each event as it
+        # arrives so memory stays flat and an interrupt keeps what was fetched
+        saved = self.save_events_data(self.collect_event_data(event_ids_list))
         
-        if not events_data:
+        if not saved:
             print("No event data collected. Exiting.")
             return
         
-        # Step 3: Save to file
-        self.save_events_data(events_data)
-        
         print("\n=== Collection Complete ===")
 
 
@@ -291,6 +294,11 @@ def main():
         default=None,
         help="Path to camps.json for enriching locations (collect camps first)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk HTTP cache and download every page again"
+    )
     
     args = parser.parse_args()
     
@@ -298,6 +306,7 @@ def main():
         output_file=args.output,
         max_events=args.max_events,
         camps_file=args.camps_file,
+        use_cache=not args.no_cache,
     )
     
     try:
@@ -3,11 +3,88 @@
 Event parser module for extracting event data from Burning Man event pages.
 """
 
+import calendar
 import re
-from datetime import datetime
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 
+try:
+    # C-backed libxml2 parser; pages are read straight from its tree
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+NON_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+# XPath equivalents of BeautifulSoup's class_ matching
+EVENT_DISPLAY_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' event-display ')]"
+ROW_XPATH = ".//div[contains(concat(' ', normalize-space(@class), ' '), ' row ')]"
+
+# Every <a> tag's href value, double-, single- or unquoted (group 1, 2 or 3).
+# The negated classes stay inside the tag; (?<![\w-]) keeps attributes such
+# as data-href from matching.
+A_HREF_RE = re.compile(
+    r"""<a\s[^>]*?(?<![\w-])href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+# An href linking to one of this year's events, and the event ID within it
+EVENT_LINK_RE = re.compile(r"/2025/playa_event/\d+/")
+EVENT_ID_RE = re.compile(r"/playa_event/(\d+)/")
+
+# Day names that start each date in a multi-day time string
+DAY_NAME_RE = re.compile(r'(Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)')
+
+# One day: "Sunday, August 24th, 2025, 12 AM – 12 AM"
+# Handles different dash types: – (en dash), — (em dash), - (hyphen)
+DAY_TIMES_RE = re.compile(r'(\w+),\s*(\w+)\s+(\d+)\w*,\s*(\d{4}),\s*(.+?)\s*[–—-]\s*(.+?)(?=\w+day|$)')
+
+# Full English month names (what strptime's %B accepts, case-insensitively)
+MONTH_NUMBERS = {
+    name: number for number, name in enumerate(
+        ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'),
+        start=1,
+    )
+}
+
+# Day of month as strptime's %d accepts it
+DAY_OF_MONTH_RE = re.compile(r'3[01]|[12]\d|0[1-9]|[1-9]')
+
+# Row labels as they appear on event pages (lowercased) and the field each fills
+EVENT_FIELD_LABELS = {
+    'dates and times': "times",
+    'date and time': "times",
+    'type': "type",
+    'located at camp': "camp",
+    'location': "location",
+    'description': "description",
+}
+
+# A digit directly followed by AM/PM, e.g. "9PM"
+AMPM_NO_SPACE_RE = re.compile(r'(\d)(AM|PM|am|pm)')
+
+
+def _parse_lxml_tree(html_content: str):
+    """Parse HTML into an lxml element tree, or return None if lxml is unavailable."""
+    if lxml_html is None or not html_content.strip():
+        return None
+    try:
+        return lxml_html.fromstring(html_content)
+    except (ValueError, lxml_html.etree.ParserError):
+        return None
+
+
+def _text_lxml(el) -> str:
+    """lxml equivalent of BeautifulSoup's get_text(strip=True)."""
+    parts = [el.text] if el.tag not in NON_TEXT_TAGS else []
+    for child in el.iterdescendants():
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+            parts.append(child.text)
+        parts.append(child.tail)
+    return "".join(t.strip() for t in parts if t)
+
 
 def extract_event_ids_from_index(html_content: str) -> List[str]:
     """
@@ -19,18 +96,12 @@ def extract_event_ids_from_index(html_content: str) -> List[str]:
     Returns:
         List of event IDs as strings
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Find all links to event pages
-    event_links = soup.find_all('a', href=re.compile(r'/2025/playa_event/\d+/'))
-    
+    # Scan the raw HTML for links to this year's events; no tree is needed
     event_ids = []
-    for link in event_links:
-        href = link.get('href')
-        match = re.search(r'/playa_event/(\d+)/', href)
-        if match:
-            event_ids.append(match.group(1))
-    
+    for m in A_HREF_RE.finditer(html_content):
+        href = m.group(m.lastindex)
+        if EVENT_LINK_RE.search(href):
+            event_ids.append(EVENT_ID_RE.search(href).group(1))
     return event_ids
 
 
@@ -46,92 +117,193 @@ def parse_time_string(time_str: str) -> List[Dict[str, str]]:
     """
     times = []
     
-    # Split by day names to handle multiple dates
-    day_pattern = r'(Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)'
-    day_matches = re.split(day_pattern, time_str)
-    
-    # Rejoin each day with its data
-    for i in range(1, len(day_matches), 2):
-        if i + 1 < len(day_matches):
-            day_name = day_matches[i]
-            day_data = day_matches[i + 1]
-            full_day_str = day_name + day_data
+    # Each day runs from its day name up to the next one (or the end), as a
+    # split on day names would give, without building the pieces
+    starts = [m.start() for m in DAY_NAME_RE.finditer(time_str)]
+    ends = starts[1:] + [len(time_str)]
+    for start, end in zip(starts, ends):
+        # Parse individual day: "Sunday, August 24th, 2025, 12 AM – 12 AM"
+        match = DAY_TIMES_RE.search(time_str, start, end)
+        
+        if match:
+            day, month, date, year, start_time, end_time = match.groups()
             
-            # Parse individual day: "Sunday, August 24th, 2025, 12 AM – 12 AM"
-            # Handle different dash types: – (en dash), — (em dash), - (hyphen)
-            match = re.search(
-                r'(\w+),\s*(\w+)\s+(\d+)\w*,\s*(\d{4}),\s*(.+?)\s*[–—-]\s*(.+?)(?=\w+day|$)',
-                full_day_str
-            )
+            # Convert to MM/DD/YYYY format
+            formatted_date = _format_date(month, date, year)
+            if formatted_date is None:
+                # Skip if date parsing fails
+                continue
+            
+            # Clean and format times
+            start_time = start_time.strip()
+            end_time = end_time.strip()
             
-            if match:
-                day, month, date, year, start_time, end_time = match.groups()
-                
-                # Convert to MM/DD/YYYY format
-                try:
-                    date_obj = datetime.strptime(f"{month} {date} {year}", "%B %d %Y")
-                    formatted_date = date_obj.strftime("%m/%d/%Y")
-                    
-                    # Clean and format times
-                    start_time = start_time.strip()
-                    end_time = end_time.strip()
-                    
-                    # Convert to 24-hour format
-                    start_24 = convert_to_24_hour(start_time)
-                    end_24 = convert_to_24_hour(end_time)
-                    
-                    times.append({
-                        "date": formatted_date,
-                        "start_time": start_24,
-                        "end_time": end_24
-                    })
-                except ValueError:
-                    # Skip if date parsing fails
-                    continue
+            # Convert to 24-hour format
+            start_24 = convert_to_24_hour(start_time)
+            end_24 = convert_to_24_hour(end_time)
+            
+            times.append({
+                "date": formatted_date,
+                "start_time": start_24,
+                "end_time": end_24
+            })
     
     return times
 
 
+def _format_date(month: str, date: str, year: str) -> Optional[str]:
+    """
+    Format "August", "24", "2025" as "08/24/2025" without strptime.
+
+    Returns:
+        The MM/DD/YYYY date, or None if it is not a real calendar date
+    """
+    month_number = MONTH_NUMBERS.get(month.lower())
+    if month_number is None or not DAY_OF_MONTH_RE.fullmatch(date):
+        return None
+    day, year_number = int(date), int(year)
+    if year_number < 1 or day > calendar.monthrange(year_number, month_number)[1]:
+        return None
+    return f"{month_number:02d}/{day:02d}/{year_number}"
+
+
+def _parse_12_hour(time_str: str) -> Optional[str]:
+    """
+    Parse "2:30 PM", "2 PM", "2:30PM" or "2PM" (any case) into "HH:MM".
+
+    Accepts exactly what strptime's "%I:%M %p" / "%I %p" formats do: an hour
+    of 1-12 in one or two digits and an optional one- or two-digit minute.
+
+    Returns:
+        The 24-hour time, or None if the string has another shape
+    """
+    upper = time_str.upper()
+    if upper.endswith('PM'):
+        pm = True
+    elif upper.endswith('AM'):
+        pm = False
+    else:
+        return None
+    hour, sep, minute = upper[:-2].rstrip().partition(':')
+    if not sep:
+        minute = '0'
+    # Same digit rules as strptime: %I is ASCII-only, %M is "[0-5]\d|\d"
+    if not (0 < len(hour) <= 2 and hour.isascii() and hour.isdigit()):
+        return None
+    if not (minute.isdecimal() and (len(minute) == 1 or (len(minute) == 2 and minute[0] in '012345'))):
+        return None
+    h = int(hour)
+    if not 1 <= h <= 12:
+        return None
+    return f"{h % 12 + (12 if pm else 0):02d}:{int(minute):02d}"
+
+
 def convert_to_24_hour(time_str: str) -> str:
     """Convert 12-hour time format to 24-hour format."""
-    try:
-        # Handle various time formats
-        time_str = time_str.strip()
+    # Handle various time formats
+    time_str = time_str.strip()
+    
+    # Handle formats like "11:45 PM", "9 PM", "12 AM", "11:45PM", "9PM"
+    if 'AM' in time_str or 'PM' in time_str or 'am' in time_str or 'pm' in time_str:
+        converted = _parse_12_hour(time_str)
+        if converted is not None:
+            return converted
+        # Unparseable: return it with a space added before AM/PM if missing
+        return AMPM_NO_SPACE_RE.sub(r'\1 \2', time_str)
+    
+    # If no AM/PM, assume it's already in 24-hour format
+    return time_str
+
+
+def _event_field_for_label(label: str) -> Optional[str]:
+    """Map a lowercased row label to the event field it fills, or None."""
+    field = EVENT_FIELD_LABELS.get(label)
+    if field is not None:
+        return field
+    
+    # Label text that differs from the usual wording: match on substrings
+    if 'dates and times' in label or 'date and time' in label:
+        return "times"
+    elif 'type' in label:
+        return "type"
+    elif 'located at camp' in label:
+        return "camp"
+    elif 'location' in label and 'camp' not in label:
+        # Location, but not "Located at Camp"
+        return "location"
+    elif 'description' in label:
+        return "description"
+    return None
+
+
+def _fill_event_field(event_data: Dict, label: str, value_text: str, camp_link) -> None:
+    """
+    Store one label/value row of the event display in event_data.
+
+    Args:
+        event_data: Event dictionary being filled in
+        label: Lowercased label text of the row
+        value_text: Stripped text of the value column
+        camp_link: (text, href) of the first link in the value column, or None
+    """
+    field = _event_field_for_label(label)
+    if field is None:
+        return
+    
+    if field == "times":
+        # Extract times
+        event_data["times"] = parse_time_string(value_text)
         
-        # Handle formats like "11:45 PM", "9 PM", "12 AM", "11:45PM", "9PM"
-        if 'AM' in time_str or 'PM' in time_str or 'am' in time_str or 'pm' in time_str:
-            # Normalize by adding space before AM/PM if missing
-            time_str = re.sub(r'(\d)(AM|PM|am|pm)', r'\1 \2', time_str)
-            
-            # Try various formats
-            formats_to_try = [
-                "%I:%M %p",  # "2:30 PM"
-                "%I %p",     # "2 PM" 
-                "%I:%M%p",   # "2:30PM" (fallback)
-                "%I%p"       # "2PM" (fallback)
-            ]
+    elif field == "camp":
+        # Extract camp name and URL
+        if camp_link:
+            event_data["camp"], event_data["campurl"] = camp_link
+        else:
+            event_data["camp"] = value_text
             
-            for fmt in formats_to_try:
-                try:
-                    time_obj = datetime.strptime(time_str.upper(), fmt)
-                    return time_obj.strftime("%H:%M")
-                except ValueError:
-                    continue
-            
-            # If still not parsed, try lowercase versions
-            for fmt in formats_to_try:
-                try:
-                    time_obj = datetime.strptime(time_str.lower(), fmt.lower())
-                    return time_obj.strftime("%H:%M")
-                except ValueError:
-                    continue
-        
-        # If no AM/PM, assume it's already in 24-hour format
-        return time_str
-        
-    except ValueError:
-        # Return original if parsing fails
-        return time_str
+    else:
+        # Type, location and description are stored as shown
+        event_data[field] = value_text
+
+
+def _page_title_fallback(page_title: str) -> str:
+    """Heuristic cleanup of a <title> element, removing site branding if present."""
+    for sep in ["|", "-", "—"]:
+        if sep in page_title:
+            return page_title.split(sep)[0].strip()
+    return page_title
+
+
+def _extract_event_data_lxml(tree, event_data: Dict) -> Dict:
+    """Fill event_data from an lxml tree, mirroring the BeautifulSoup walk below."""
+    event_display = next(iter(tree.xpath(EVENT_DISPLAY_XPATH)), None)
+    if event_display is None:
+        return event_data
+
+    title_tag = next(iter(event_display.xpath(".//*[self::h1 or self::h2]")), None)
+    if title_tag is None:
+        title_tag = next(iter(tree.xpath("//h1")), None)
+    if title_tag is None:
+        title_tag = next(iter(tree.xpath("//h2")), None)
+    if title_tag is not None:
+        event_data["title"] = _text_lxml(title_tag)
+    else:
+        page_title = next(iter(tree.xpath("//title")), None)
+        event_data["title"] = _page_title_fallback(_text_lxml(page_title) if page_title is not None else "")
+
+    for row in event_display.xpath(ROW_XPATH):
+        cols = row.xpath(".//div")
+        if len(cols) >= 2:
+            value_element = cols[1]
+            camp_link = next(value_element.iter('a'), None)
+            _fill_event_field(
+                event_data,
+                _text_lxml(cols[0]).lower(),
+                _text_lxml(value_element),
+                (_text_lxml(camp_link), camp_link.get('href', '')) if camp_link is not None else None,
+            )
+
+    return event_data
 
 
 def extract_event_data(html_content: str, event_id: str) -> Dict:
@@ -145,8 +317,6 @@ def extract_event_data(html_content: str, event_id: str) -> Dict:
     Returns:
         Dictionary with event data matching the required structure
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
     event_data = {
         "id": event_id,
         "title": "",
@@ -158,6 +328,13 @@ def extract_event_data(html_content: str, event_id: str) -> Dict:
         "description": ""
     }
     
+    tree = _parse_lxml_tree(html_content)
+    if tree is not None:
+        return _extract_event_data_lxml(tree, event_data)
+    
+    # Only reached without lxml or for pages libxml2 rejects; parsed once here
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    
     # Find the event display container
     event_display = soup.find('div', class_='event-display')
     if not event_display:
@@ -169,13 +346,9 @@ def extract_event_data(html_content: str, event_id: str) -> Dict:
         event_data["title"] = title_tag.get_text(strip=True)
     else:
         # Fallback to <title> element, removing site branding if present
-        page_title = soup.find('title').get_text(strip=True) if soup.find('title') else ""
-        # Heuristic cleanup
-        for sep in ["|", "-", "—"]:
-            if sep in page_title:
-                page_title = page_title.split(sep)[0].strip()
-                break
-        event_data["title"] = page_title
+        title_element = soup.find('title')
+        page_title = title_element.get_text(strip=True) if title_element else ""
+        event_data["title"] = _page_title_fallback(page_title)
 
     # Find all data rows
     rows = event_display.find_all('div', class_='row')
@@ -183,34 +356,14 @@ def extract_event_data(html_content: str, event_id: str) -> Dict:
     for row in rows:
         cols = row.find_all('div')
         if len(cols) >= 2:
-            label = cols[0].get_text(strip=True).lower()
             value_element = cols[1]
-            
-            if 'dates and times' in label or 'date and time' in label:
-                # Extract times
-                time_text = value_element.get_text(strip=True)
-                event_data["times"] = parse_time_string(time_text)
-                
-            elif 'type' in label:
-                # Extract type
-                event_data["type"] = value_element.get_text(strip=True)
-                
-            elif 'located at camp' in label:
-                # Extract camp name and URL
-                camp_link = value_element.find('a')
-                if camp_link:
-                    event_data["camp"] = camp_link.get_text(strip=True)
-                    event_data["campurl"] = camp_link.get('href', '')
-                else:
-                    event_data["camp"] = value_element.get_text(strip=True)
-                    
-            elif 'location' in label and 'camp' not in label:
-                # Extract location (but not "Located at Camp")
-                event_data["location"] = value_element.get_text(strip=True)
-                
-            elif 'description' in label:
-                # Extract description
-                event_data["description"] = value_element.get_text(strip=True)
+            camp_link = value_element.find('a')
+            _fill_event_field(
+                event_data,
+                cols[0].get_text(strip=True).lower(),
+                value_element.get_text(strip=True),
+                (camp_link.get_text(strip=True), camp_link.get('href', '')) if camp_link else None,
+            )
     
     return event_data
 
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+HTTP fetching utilities shared by the directory collectors.
+
+Pages are fetched concurrently on a thread pool over a single
+`requests.Session`, while a shared rate limiter keeps the overall request
+rate as polite as the previous one-request-per-delay loop.
+
+When `requests-cache` is installed, responses are persisted to a local SQLite
+cache so reruns skip the network (and the rate limiter) for pages already seen.
+"""
+
+import io
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # Optional: fall back to an uncached session
+    requests_cache = None
+
+
+MAX_WORKERS = 8
+
+CACHE_NAME = str(Path(__file__).resolve().parent / "burnbot_cache")
+CACHE_EXPIRE_AFTER = 86400  # Seconds; one day
+
+# Transient failures are retried with exponential backoff (honouring
+# Retry-After on 429) before fetch_pages reports the page as failed
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """
+    Space request starts at least `interval` seconds apart across all threads.
+
+    Each caller reserves the next free time slot under a lock and then sleeps
+    outside the lock until its slot arrives.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def create_session(user_agent: str, use_cache: bool = True) -> requests.Session:
+    """
+    Build the HTTP session used by a collector.
+
+    Connections are pooled and kept alive across requests, and GETs that fail
+    with a connection error or a transient status are retried.
+
+    Args:
+        user_agent: User-Agent header sent with every request
+        use_cache: Persist responses to the on-disk cache when requests-cache
+            is available; pass False to force a fresh download
+
+    Returns:
+        A `requests_cache.CachedSession` or a plain `requests.Session`
+    """
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER)
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET",),
+        # Hand the last error response back so raise_for_status reports it
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({'User-Agent': user_agent})
+    return session
+
+
+def _is_cached_session(session: requests.Session) -> bool:
+    return requests_cache is not None and isinstance(session, requests_cache.CachedSession)
+
+
+def fetch_pages(
+    session: requests.Session,
+    urls: List[str],
+    limiter: RateLimiter,
+    timeout: float,
+    max_workers: int = MAX_WORKERS,
+) -> Iterator[Tuple[int, str, Optional[str], Optional[Exception]]]:
+    """
+    Fetch URLs concurrently and yield results as they complete.
+
+    Args:
+        session: Shared session (connection pool) used for every GET
+        urls: URLs to fetch
+        limiter: Rate limiter shared by all workers
+        timeout: Per-request timeout in seconds
+        max_workers: Number of concurrent fetches
+
+    Yields:
+        (index, url, html, error) in completion order, where index is the
+        position in `urls` and exactly one of html/error is None
+    """
+
+    cached = _is_cached_session(session)
+
+    def _get(url: str) -> str:
+        if cached:
+            # Cache hits cost no request, so they skip the rate limiter entirely;
+            # a miss comes back as 504 Not Cached
+            response = session.get(url, timeout=timeout, only_if_cached=True)
+            if response.status_code != 504:
+                response.raise_for_status()
+                return response.text
+        limiter.wait()
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(_get, url): idx for idx, url in enumerate(urls)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                yield idx, urls[idx], future.result(), None
+            except requests.RequestException as e:
+                yield idx, urls[idx], None, e
+    finally:
+        # Drop queued fetches if the consumer stops early (e.g. Ctrl+C)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def in_index_order(
+    results: Iterator[Tuple[int, str, Optional[str], Optional[Exception]]],
+) -> Iterator[Tuple[int, str, Optional[str], Optional[Exception]]]:
+    """
+    Re-emit fetch_pages results in index order.
+
+    Early arrivals are held only until the pages before them complete, so the
+    buffer stays around the size of the worker pool rather than the whole run.
+    """
+    pending = {}
+    next_idx = 0
+    for result in results:
+        pending[result[0]] = result
+        while next_idx in pending:
+            yield pending.pop(next_idx)
+            next_idx += 1
+
+
+def fetch_sitemap_links(
+    session: requests.Session,
+    sitemap_url: str,
+    path_re: Pattern[str],
+    limiter: RateLimiter,
+    timeout: float,
+) -> List[str]:
+    """
+    List detail page URLs from a sitemap in a single request.
+
+    The XML is parsed incrementally with iterparse and each element is cleared
+    once handled, so large sitemaps are never held as a full tree.
+
+    Args:
+        session: Shared session used for the GET
+        sitemap_url: Absolute URL of sitemap.xml
+        path_re: Pattern matched against each <loc> path; group 1 is the
+            canonical path without trailing slash (e.g. "/artwork/123")
+        limiter: Rate limiter shared with the other fetches
+        timeout: Request timeout in seconds
+
+    Returns:
+        De-duplicated absolute URLs in sitemap order, or an empty list when
+        the sitemap is missing or unreadable so callers can fall back
+    """
+    limiter.wait()
+    try:
+        response = session.get(sitemap_url, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException:
+        return []
+
+    parts = urlsplit(sitemap_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    links: List[str] = []
+    try:
+        for _, elem in ET.iterparse(io.BytesIO(response.content)):
+            # Tags are namespaced, e.g. "{http://www.sitemaps.org/schemas/sitemap/0.9}loc"
+            if elem.tag.rsplit('}', 1)[-1] == 'loc' and elem.text:
+                m = path_re.match(urlsplit(elem.text.strip()).path)
+                if m:
+                    links.append(origin + m.group(1) + '/')
+            elem.clear()
+    except ET.ParseError:
+        return []
+
+    return list(dict.fromkeys(links))
+
+
+__all__ = [
+    "RateLimiter",
+    "create_session",
+    "fetch_pages",
+    "fetch_sitemap_links",
+    "in_index_order",
+]
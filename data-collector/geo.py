@@ -17,7 +17,8 @@ The mapping uses a standard clock-to-bearing mapping: 12:00=0°, 3:00=90°, 6:00
 """
 
 from dataclasses import dataclass
-from math import radians, degrees, cos, sin, atan2, sqrt
+from functools import lru_cache
+from math import radians, degrees, cos, sin, atan2, sqrt, hypot
 from typing import Dict, Tuple
 
 
@@ -68,22 +69,46 @@ def _meters_per_degree(lat: float) -> Tuple[float, float]:
     return m_per_deg_lat, m_per_deg_lon
 
 
+# Every offset is taken from the Man, so the scale factors are fixed
+M_PER_DEG_LAT_AT_MAN, M_PER_DEG_LON_AT_MAN = _meters_per_degree(MAN_LAT)
+
+
 def _bearing_from_clock(clock_hhmm: str) -> float:
     """
     Convert a clock time (e.g., "9:00", "4:30", "2:15") to a bearing in degrees
     from north, clockwise. 12:00 = 0°, 3:00 = 90°, 6:00 = 180°, 9:00 = 270°.
     """
-    hh, mm = clock_hhmm.split(":")
-    hours = int(hh) % 12
-    minutes = int(mm)
-    frac_hours = hours + minutes / 60.0
-    return (frac_hours / 12.0) * 360.0
+    sep = clock_hhmm.find(":")
+    if sep < 0:
+        raise ValueError(f"Invalid clock time '{clock_hhmm}'. Expected H:MM.")
+    hours = int(clock_hhmm[:sep]) % 12
+    minutes = int(clock_hhmm[sep + 1:])
+    # 30° per hour and 0.5° per minute; exact in floating point
+    return hours * 30.0 + minutes * 0.5
+
+
+@lru_cache(maxsize=1024)
+def _sin_cos_from_clock(clock_hhmm: str) -> Tuple[float, float]:
+    """Return (sin, cos) of the bearing for a clock time."""
+    bearing_rad = radians(_bearing_from_clock(clock_hhmm))
+    return sin(bearing_rad), cos(bearing_rad)
+
+
+# Radial streets run 2:00-10:00 in 15-minute steps; their bearings are looked up
+CLOCK_SIN_COS: Dict[str, Tuple[float, float]] = {
+    clock: _sin_cos_from_clock(clock)
+    for clock in (f"{h}:{m:02d}" for h in range(2, 11) for m in (0, 15, 30, 45) if h < 10 or m == 0)
+}
 
 
 def _precompute_radii_m() -> Dict[str, float]:
+    # BRC spans under 2 km, so measure in the same flat projection that
+    # ring_clock_to_latlon uses to map radii back to lat/lon
     radii: Dict[str, float] = {}
     for ring, coord in RING_COORDS_9.items():
-        radii[ring] = _haversine_m(MAN_LAT, MAN_LON, coord.lat, coord.lon)
+        north_m = (coord.lat - MAN_LAT) * M_PER_DEG_LAT_AT_MAN
+        east_m = (coord.lon - MAN_LON) * M_PER_DEG_LON_AT_MAN
+        radii[ring] = hypot(north_m, east_m)
     return radii
 
 
@@ -106,16 +131,14 @@ def ring_clock_to_latlon(ring: str, clock_hhmm: str) -> Tuple[float, float]:
         raise ValueError(f"Unknown ring '{ring}'. Expected 'Esplanade' or A..K.")
 
     radius_m = RING_RADII_M[rkey]
-    bearing_deg = _bearing_from_clock(clock_hhmm)
-    bearing_rad = radians(bearing_deg)
+    sin_b, cos_b = CLOCK_SIN_COS.get(clock_hhmm) or _sin_cos_from_clock(clock_hhmm)
 
     # Convert polar (radius, bearing) to local ENU offsets (meters)
-    north_m = radius_m * cos(bearing_rad)
-    east_m = radius_m * sin(bearing_rad)
+    north_m = radius_m * cos_b
+    east_m = radius_m * sin_b
 
-    m_per_deg_lat, m_per_deg_lon = _meters_per_degree(MAN_LAT)
-    dlat = north_m / m_per_deg_lat
-    dlon = east_m / m_per_deg_lon
+    dlat = north_m / M_PER_DEG_LAT_AT_MAN
+    dlon = east_m / M_PER_DEG_LON_AT_MAN
 
     return (MAN_LAT + dlat, MAN_LON + dlon)
 
@@ -132,15 +155,13 @@ def clock_and_distance_to_latlon(clock_hhmm: str, distance_feet: float) -> Tuple
         (lat, lon) tuple
     """
     radius_m = float(distance_feet) * 0.3048
-    bearing_deg = _bearing_from_clock(clock_hhmm)
-    bearing_rad = radians(bearing_deg)
+    sin_b, cos_b = CLOCK_SIN_COS.get(clock_hhmm) or _sin_cos_from_clock(clock_hhmm)
 
-    north_m = radius_m * cos(bearing_rad)
-    east_m = radius_m * sin(bearing_rad)
+    north_m = radius_m * cos_b
+    east_m = radius_m * sin_b
 
-    m_per_deg_lat, m_per_deg_lon = _meters_per_degree(MAN_LAT)
-    dlat = north_m / m_per_deg_lat
-    dlon = east_m / m_per_deg_lon
+    dlat = north_m / M_PER_DEG_LAT_AT_MAN
+    dlon = east_m / M_PER_DEG_LON_AT_MAN
 
     return (MAN_LAT + dlat, MAN_LON + dlon)
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON file helpers shared by the collectors.
+
+Uses orjson (serializes in native code and emits UTF-8 bytes directly) when
+installed, and falls back to the standard library otherwise. Both paths write
+2-space indented, non-ASCII-escaped JSON, and read_json parses with orjson too.
+
+JsonArrayWriter streams a top-level array item by item and produces the same
+bytes as write_json would for the full list.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """Serialize `data` to `path` as indented UTF-8 JSON."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Parse the UTF-8 JSON file at `path`."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize `data` like write_json does, as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON array to disk one item at a time.
+
+    Items go to `<path>.partial` as they arrive, so memory stays flat and an
+    interrupted run keeps every record written so far. Leaving the `with`
+    block normally terminates the array and renames it to `path`; an array
+    with no items is discarded instead of being written. On an exception the
+    partial file is left in place and `path` is not touched.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + '.partial')
+        self.count = 0
+        self._file = None
+
+    def __enter__(self) -> "JsonArrayWriter":
+        self._file = open(self.partial_path, 'wb')
+        self._file.write(b'[')
+        return self
+
+    def write(self, item: Any) -> None:
+        # Strings never contain raw newlines, so indenting every line nests
+        # the item exactly as a whole-list dump would
+        self._file.write(b',\n  ' if self.count else b'\n  ')
+        self._file.write(_dumps_indented(item).replace(b'\n', b'\n  '))
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._file.close()
+            return
+        self._file.write(b'\n]')
+        self._file.close()
+        if self.count:
+            os.replace(self.partial_path, self.path)
+        else:
+            self.partial_path.unlink()
+
+
+__all__ = [
+    "JsonArrayWriter",
+    "read_json",
+    "write_json",
+]
@@ -18,15 +18,32 @@ Examples:
 """
 
 import argparse
-import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-
-TIME_PATTERN = re.compile(r"\b((?:[0-1]?\d|2[0-3]):[0-5]\d)\b")
+from jsonio import read_json, write_json
 
 
+# The helpers below are pure and memoized: many camps share a location string
+TIME_PATTERN = re.compile(r"\b((?:[0-1]?\d|2[0-3]):[0-5]\d)\b")
+ESPLANADE_PATTERN = re.compile(r"\bEsplanade\b", re.IGNORECASE)
+RING_LETTER_PATTERN = re.compile(r"\b([A-Ka-k])\b")
+RING_PLAZA_PATTERN = re.compile(r"\b([A-Ka-k])\s*(?:Plaza|Plz)\b", re.IGNORECASE)
+WORD_PATTERN = re.compile(r"\b([A-Za-z][A-Za-z\-']*)\b")
+RING_LETTERS = frozenset("ABCDEFGHIJK")
+PAREN_PATTERN = re.compile(r"\s*\([^)]*\)")
+COMMA_TAIL_PATTERN = re.compile(r",.*$")
+# Both of the above in one pass; only equivalent when there is no newline,
+# because "$" also matches before a final newline
+CLEANUP_PATTERN = re.compile(r"\s*\([^)]*\)|,.*$")
+# '@' is treated as '&'
+AMP_PATTERN = re.compile(r"\s*[@&]\s*")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def extract_clock(text: str) -> Optional[str]:
     """Return the last clock-position time (H:MM) found in the text, if any."""
     if not text:
@@ -37,6 +54,7 @@ def extract_clock(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
 def extract_ring(text: str) -> Optional[str]:
     """Extract the ring identifier: 'Esplanade' or a single letter A..K."""
     if not text:
@@ -45,43 +63,46 @@ def extract_ring(text: str) -> Optional[str]:
     s = text.strip()
 
     # Special case: Esplanade (distinct from letter E)
-    if re.search(r"\bEsplanade\b", s, flags=re.IGNORECASE):
+    if ESPLANADE_PATTERN.search(s):
         return "Esplanade"
 
     # Single letter ring token A..K
-    m = re.search(r"\b([A-Ka-k])\b", s)
+    m = RING_LETTER_PATTERN.search(s)
     if m:
         return m.group(1).upper()
 
     # Patterns like "G Plaza" / "G Plz"
-    m = re.search(r"\b([A-Ka-k])\s*(?:Plaza|Plz)\b", s, flags=re.IGNORECASE)
+    m = RING_PLAZA_PATTERN.search(s)
     if m:
         return m.group(1).upper()
 
-    # Named street: use initial letter if within A..K
-    for word in re.findall(r"\b([A-Za-z][A-Za-z\-']*)\b", s):
+    # Named street: use initial letter if within A..K (scan stops at the first hit)
+    for m in WORD_PATTERN.finditer(s):
+        word = m.group(1)
         if word.lower() == 'esplanade':
             return 'Esplanade'
         first = word[0].upper()
-        if first in "ABCDEFGHIJK":
+        if first in RING_LETTERS:
             return first
 
     return None
 
 
+@lru_cache(maxsize=4096)
 def normalize_location(raw_location: str) -> str:
     """Normalize a raw location value to "<Ring> & <Clock>" when possible."""
     if not raw_location:
         return ""
 
     # Remove parenthetical notes and trailing comma sections (e.g., ", Man side")
-    s = re.sub(r"\s*\([^)]*\)", "", raw_location)
-    s = re.sub(r",.*$", "", s)
+    if '\n' in raw_location:
+        s = COMMA_TAIL_PATTERN.sub("", PAREN_PATTERN.sub("", raw_location))
+    else:
+        s = CLEANUP_PATTERN.sub("", raw_location)
 
-    # Normalize separators
-    s = s.replace('@', '&')
-    s = re.sub(r"\s*&\s*", " & ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    # Normalize separators ('@' counts as '&')
+    s = AMP_PATTERN.sub(" & ", s)
+    s = WHITESPACE_PATTERN.sub(" ", s).strip()
 
     ring = extract_ring(s)
     clock = extract_clock(s)
@@ -107,16 +128,15 @@ def normalize_location(raw_location: str) -> str:
 
 
 def process_file(input_path: Path, output_path: Optional[Path] = None) -> None:
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data: List[Dict[str, Any]] = json.load(f)
+    data: List[Dict[str, Any]] = read_json(input_path)
 
-    for entry in data:
-        raw_loc = entry.get('location', '') or ''
-        entry['normalized_location'] = normalize_location(raw_loc)
+    # Normalize every location in one pass, then attach the results
+    normalized = [normalize_location(entry.get('location', '') or '') for entry in data]
+    for entry, norm_loc in zip(data, normalized):
+        entry['normalized_location'] = norm_loc
 
     out_path = output_path or input_path
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json(out_path, data)
 
 
 def main():
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test the Website lookup of camp detail pages.
+"""
+
+from camp_parser import extract_camp_data
+
+HEAD = '<h1>Camp: Foo</h1><div><strong>Location:</strong> 7:30 &amp; E</div>'
+TAIL = '<div><strong>Description:</strong></div><p>We do things.</p>'
+DETAIL_URL = "https://directory.burningman.org/camps/1/"
+
+
+def website(html_content):
+    return extract_camp_data(html_content, DETAIL_URL)["website"]
+
+
+def test_website_ignores_website_in_head_attributes():
+    """og:type="website" and stylesheet links in <head> are not the camp site."""
+    html_content = (
+        '<html><head><meta property="og:type" content="website">'
+        '<link rel="stylesheet" href="https://cdn.example.com/x.css"></head><body>'
+        + HEAD + '<p>Website: <a href="https://foo.camp">foo.camp</a></p>' + TAIL
+        + '</body></html>'
+    )
+    assert website(html_content) == "https://foo.camp"
+
+
+def test_website_ignores_website_in_running_text():
+    """A nav entry "Our website" followed by a donate link is not the label."""
+    html_content = (
+        '<nav><a>Our website</a> <a href="https://donate.burningman.org">Donate</a></nav>'
+        + HEAD + '<p>Website: <a href="https://foo.camp">foo.camp</a></p>' + TAIL
+    )
+    assert website(html_content) == "https://foo.camp"
+
+
+def test_website_strong_label_returns_href():
+    """A <strong>Website:</strong> label yields the link's href.
+
+    The soup-only parser returned the link text ("foo.camp") for this layout;
+    the href is returned now.
+    """
+    html_content = (
+        HEAD + '<div><strong>Website:</strong> <a href="https://foo.camp">foo.camp</a></div>' + TAIL
+    )
+    assert website(html_content) == "https://foo.camp"
+
+
+def test_website_walk_passes_unlabelled_description_text():
+    """A sibling starting "Description of ..." without a colon is not a label."""
+    html_content = (
+        HEAD + '<div><div>Website:</div>'
+        '<p>Description of our camp is long ' + 'x' * 120 + ' our site</p>'
+        '<p><a href="https://foo.camp">site</a></p></div>'
+        + TAIL + '<a href="https://other.org">o</a>'
+    )
+    assert website(html_content) == "https://foo.camp"
+
+
+def test_website_walk_stops_at_label_with_colon_in_separate_node():
+    """<b>Location</b>: ends the walk although the colon is a separate text node."""
+    html_content = (
+        '<p><a href="https://first.org">f</a></p>'
+        + HEAD + '<div><div>Website:</div>'
+        '<div><b>Location</b>: 5:00 &amp; B</div>'
+        '<div><a href="https://later.org">l</a></div></div>'
+        + TAIL
+    )
+    # The walk finds nothing, so the first external link on the page wins
+    assert website(html_content) == "https://first.org"
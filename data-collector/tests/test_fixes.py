@@ -4,8 +4,10 @@ Test the fixes for time parsing issues.
 """
 
 from event_parser import convert_to_24_hour, parse_time_string
+import pytest
 import requests
 from event_parser import extract_event_data
+from event_parser import _format_date, _parse_12_hour
 
 def test_convert_fixes():
     """Test the improved convert_to_24_hour function."""
@@ -36,6 +38,7 @@ def test_problematic_strings():
         result = parse_time_string(time_str)
         print(f"'{time_str}' -> {result}")
 
+@pytest.mark.network
 def test_real_event_50893():
     """Test the real event that was failing."""
     
@@ -55,6 +58,33 @@ def test_real_event_50893():
     except Exception as e:
         print(f"Error: {e}")
 
+@pytest.mark.parametrize("time_str, expected", [
+    ("12 AM", "00:00"),
+    ("12:05 PM", "12:05"),
+    ("9PM", "21:00"),
+    ("9 pm", "21:00"),
+    ("9:15 Pm", "21:15"),
+    ("13 PM", None),
+    ("1:60 PM", None),
+])
+def test_parse_12_hour_edge_cases(time_str, expected):
+    """_parse_12_hour accepts and rejects what the strptime formats did."""
+    assert _parse_12_hour(time_str) == expected
+
+
+@pytest.mark.parametrize("month, date, year, expected", [
+    ("February", "29", "2024", "02/29/2024"),
+    ("February", "29", "2025", None),
+    ("August", "0", "2025", None),
+    ("August", "05", "2025", "08/05/2025"),
+    ("Sept", "1", "2025", None),
+    ("September", "1", "2025", "09/01/2025"),
+])
+def test_format_date_edge_cases(month, date, year, expected):
+    """_format_date accepts and rejects what strptime's "%B %d %Y" did."""
+    assert _format_date(month, date, year) == expected
+
+
 if __name__ == "__main__":
     test_convert_fixes()
     test_problematic_strings() 
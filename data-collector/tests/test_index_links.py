@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test the raw-HTML link scans of the index pages.
+"""
+
+from art_parser import extract_art_links_from_index
+from camp_parser import extract_camp_links_from_index
+from event_parser import extract_event_ids_from_index
+
+
+def test_event_ids_any_href_quoting_or_case():
+    """Event links are found whatever the tag/attribute case or quoting."""
+    html_content = (
+        '<a href="/2025/playa_event/123/">a</a>'
+        "<A class=z HREF='https://x/2025/playa_event/45/?a'>b</A>"
+        "<a href=/2025/playa_event/77/>c</a>"
+        '<a data-href="/2025/playa_event/9/">d</a>'
+        '<a href="/2024/playa_event/8/">e</a>'
+    )
+    assert extract_event_ids_from_index(html_content) == ["123", "45", "77"]
+
+
+def test_art_links_any_href_quoting_or_case():
+    """Artwork links are found whatever the attribute case or quoting."""
+    html_content = (
+        '<a href="/artwork/1/">a</a>'
+        '<a HREF="/artwork/2/">b</a>'
+        "<a href=/artwork/3/>c</a>"
+        "<A href='/artwork/4?x=1'>d</A>"
+        '<a data-href="/artwork/5/">e</a>'
+        '<a href="/artwork/6/edit/">f</a>'
+        '<a href="/artwork/1/#top">g</a>'
+    )
+    base = "https://directory.burningman.org"
+    assert extract_art_links_from_index(html_content) == [
+        f"{base}/artwork/{n}/" for n in (1, 2, 3, 4)
+    ]
+
+
+def test_camp_links_any_href_quoting_or_case():
+    """Camp links are found whatever the attribute case or quoting."""
+    html_content = (
+        '<a href="/camps/10/">a</a>'
+        '<a HREF="/camps/11/">b</a>'
+        "<a class=c href=/camps/12>c</a>"
+        '<a data-href="/camps/13/">d</a>'
+        '<a href="https://other.org/camps/14/">e</a>'
+    )
+    base = "https://directory.burningman.org"
+    assert extract_camp_links_from_index(html_content) == [
+        f"{base}/camps/{n}/" for n in (10, 11, 12)
+    ]
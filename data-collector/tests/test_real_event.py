@@ -3,9 +3,11 @@
 Test parsing with a real event that contains the problematic time formats.
 """
 
+import pytest
 import requests
 from event_parser import extract_event_data
 
+@pytest.mark.network
 def test_real_events_with_problematic_times():
     """Download and test real events that might have the problematic time formats."""
     
@@ -22,6 +22,12 @@ class UserResponse(BaseModel):
 router = APIRouter(prefix="", tags=["auth"])  # mount at /auth/* via include_router
 
 
+def _remember_user(request: Request, user: User) -> None:
+    # The session cookie is signed, so /auth/me can answer from it without a query
+    request.session["user_id"] = int(user.id)
+    request.session["username"] = user.username
+
+
 @router.post("/auth/register", response_model=UserResponse, status_code=201)
 def register(payload: AuthPayload, request: Request, db: Session = Depends(get_db)) -> UserResponse:
     existing = db.query(User).filter(User.username == payload.username).first()
@@ -33,7 +39,7 @@ def register(payload: AuthPayload, request: Request, db: Session = Depends(get_d
     db.commit()
     db.refresh(user)
 
-    request.session["user_id"] = int(user.id)
+    _remember_user(request, user)
     return UserResponse(id=int(user.id), username=user.username)
 
 
@@ -43,16 +49,13 @@ def login(payload: AuthPayload, request: Request, db: Session = Depends(get_db))
     if not user or not verify_password(payload.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    request.session["user_id"] = int(user.id)
+    _remember_user(request, user)
     return UserResponse(id=int(user.id), username=user.username)
 
 
 @router.post("/auth/logout")
 def logout(request: Request) -> dict:
-    # Clear any session keys safely
-    for key in list(request.session.keys()):
-        request.session.pop(key, None)
-    # Explicitly reset session data
+    # Drop every session key (user_id and the cached username)
     request.session.clear()
     return {"ok": True}
 
@@ -62,9 +65,14 @@ def me(request: Request, db: Session = Depends(get_db)) -> UserResponse:
     user_id = request.session.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
+    username = request.session.get("username")
+    if username:
+        return UserResponse(id=int(user_id), username=username)
+    # Sessions created before the username was stored: look it up once
     user = db.get(User, int(user_id))
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
+    _remember_user(request, user)
     return UserResponse(id=int(user.id), username=user.username)
 
 
@@ -3,10 +3,10 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from typing import List
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.db import get_db
-from app.models.auth import User
 from app.models.favorites import Favorite
 
 
@@ -26,39 +26,40 @@ class FavoriteEvent(BaseModel):
 router = APIRouter(prefix="/favorites", tags=["favorites"])  # mounted at /favorites
 
 
-def require_user(request: Request, db: Session) -> User:
+def require_user_id(request: Request) -> int:
+    # Trust the signed session cookie; every route here only needs the id
     user_id = request.session.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    user = db.get(User, int(user_id))
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    return user
+    return int(user_id)
 
 
 @router.get("", response_model=List[FavoriteEvent])
 def list_favorites(request: Request, db: Session = Depends(get_db)) -> List[FavoriteEvent]:
-    user = require_user(request, db)
-    favs = db.query(Favorite).filter(Favorite.user_id == user.id).order_by(Favorite.id.asc()).all()
-    return [FavoriteEvent.model_validate_json(f.event_json) for f in favs]
+    user_id = require_user_id(request)
+    rows = db.query(Favorite.event_json).filter(Favorite.user_id == user_id).order_by(Favorite.id.asc()).all()
+    # favorites_sync may overwrite event_json with the raw events.json item, so validate it
+    return [FavoriteEvent.model_validate_json(event_json) for (event_json,) in rows]
 
 
 @router.post("", response_model=FavoriteEvent)
 def add_favorite(event: FavoriteEvent, request: Request, db: Session = Depends(get_db)) -> FavoriteEvent:
-    user = require_user(request, db)
-    existing = db.query(Favorite).filter(Favorite.user_id == user.id, Favorite.event_id == event.id).first()
-    if existing:
-        return event
-    fav = Favorite(user_id=int(user.id), event_id=event.id, event_json=event.model_dump_json())
-    db.add(fav)
+    user_id = require_user_id(request)
+    # One statement; uq_favorites_user_event turns a repeat add into a no-op
+    stmt = (
+        sqlite_insert(Favorite)
+        .values(user_id=user_id, event_id=event.id, event_json=event.model_dump_json())
+        .on_conflict_do_nothing(index_elements=["user_id", "event_id"])
+    )
+    db.execute(stmt)
     db.commit()
     return event
 
 
 @router.delete("/{event_id}")
 def remove_favorite(event_id: str, request: Request, db: Session = Depends(get_db)) -> dict:
-    user = require_user(request, db)
-    deleted = db.query(Favorite).filter(Favorite.user_id == user.id, Favorite.event_id == event_id).delete()
+    user_id = require_user_id(request)
+    deleted = db.query(Favorite).filter(Favorite.user_id == user_id, Favorite.event_id == event_id).delete()
     db.commit()
     return {"deleted": deleted > 0}
 
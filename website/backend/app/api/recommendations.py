@@ -12,14 +12,14 @@ service = RecommendationService()
 
 
 @router.post("/recommend", response_model=RecommendationResponse)
-def post_recommend(request: RecommendationRequest) -> RecommendationResponse:
+async def post_recommend(request: RecommendationRequest) -> RecommendationResponse:
     if not request.query or not request.query.strip():
         raise HTTPException(status_code=400, detail="Query must not be empty")
 
     start = time.time()
     try:
         # Primary recommendations and optional rationale
-        events, rationale_text = service.get_recommendations(request.query, request.max_results)
+        events, rationale_text = await service.get_recommendations(request.query, request.max_results)
         rationale: str | None = None
         if rationale_text:
             sentences = [s.strip() for s in rationale_text.replace("\n", " ").split(".") if s.strip()]
@@ -36,9 +36,9 @@ def post_recommend(request: RecommendationRequest) -> RecommendationResponse:
 
 @router.get("/events/{event_id}")
 def get_event(event_id: str):
-    for ev in service.events:
-        if ev.id == event_id:
-            return ev
-    raise HTTPException(status_code=404, detail="Event not found")
+    ev = service.get_event(event_id)
+    if ev is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return ev
 
 
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
 
@@ -16,6 +16,18 @@ DB_PATH = os.environ.get("SQLITE_DB_PATH", str(DATA_DIR / "app.db"))
 engine = create_engine(
     f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False}
 )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # WAL lets reads run alongside a write; with WAL, synchronous=NORMAL only
+    # fsyncs at checkpoints instead of on every commit
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -29,6 +41,9 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+_REDUNDANT_INDEXES = ("ix_favorites_user_id", "ix_users_username")
+
+
 def init_db() -> None:
     # Import models to register metadata
     from app.models.auth import User  # noqa: F401
@@ -36,4 +51,10 @@ def init_db() -> None:
 
     Base.metadata.create_all(bind=engine)
 
+    # Drop indexes made redundant by the unique constraints; databases
+    # created by earlier versions still carry them
+    with engine.begin() as conn:
+        for index_name in _REDUNDANT_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
 
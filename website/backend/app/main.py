@@ -1,17 +1,144 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
+import asyncio
+import hashlib
+import mimetypes
 import os
 from pathlib import Path
-from fastapi.responses import FileResponse
+from typing import Dict, Tuple
+from fastapi.responses import Response
 from starlette.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import Scope
 
-from app.api.recommendations import router as recommendations_router
+from app.api.recommendations import router as recommendations_router, service as recommendation_service
 from app.api.auth import router as auth_router
 from app.api.favorites import router as favorites_router
-from app.db import init_db, SessionLocal
-from app.services.favorites_sync import sync_favorites_with_events
+from app.db import init_db
+from app.services.favorites_sync import run_favorites_sync
+
+
+# Vite asset filenames carry a content hash, so they can be cached forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed assets, marked cacheable for a year."""
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+def _load_static_cache(root: Path) -> Dict[str, Tuple[bytes, str, str]]:
+    """Read every file under ``root`` into memory.
+
+    Returns a mapping of POSIX path relative to ``root`` to
+    ``(body, content_type, etag)`` with a strong ETag over the body.
+    """
+    cache: Dict[str, Tuple[bytes, str, str]] = {}
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        cache[path.relative_to(root).as_posix()] = (body, content_type, etag)
+    return cache
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _cached_response(request: Request, entry: Tuple[bytes, str, str], cache_control: str) -> Response:
+    body, content_type, etag = entry
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=content_type, headers=headers)
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in {"1", "true", "yes"}
+
+
+def _run_favorites_sync() -> None:
+    try:
+        run_favorites_sync()
+    except Exception as exc:  # Never take the server down over a stale favorite
+        print(f"Favorites sync failed: {exc}")
+
+
+async def _warm_up_recommendations() -> None:
+    try:
+        await recommendation_service.warm_up()
+    except Exception as exc:  # The first request loads lazily instead
+        print(f"Recommendation warm-up failed: {exc}")
+
+
+def mount_frontend(app: FastAPI, frontend_dist: Path) -> None:
+    """Serve a Vite build at / with an SPA fallback; no-op if it has not been built.
+
+    Args:
+        app: Application to register the routes on.
+        frontend_dist: The build output directory containing index.html.
+    """
+    index_html = frontend_dist / "index.html"
+
+    if frontend_dist.exists() and index_html.exists():
+        # The build does not change while the server runs, so read it once and
+        # serve bytes from memory instead of opening and stat-ing per request
+        static_cache = _load_static_cache(frontend_dist)
+
+        # Serve hashed assets at /assets/*
+        assets_dir = frontend_dist / "assets"
+        if assets_dir.exists():
+            # Files added after startup are still served from disk
+            assets_files = ImmutableStaticFiles(directory=str(assets_dir))
+
+            @app.api_route("/assets/{asset_path:path}", methods=["GET", "HEAD"], name="assets")
+            async def serve_asset(asset_path: str, request: Request) -> Response:
+                entry = static_cache.get(f"assets/{asset_path}")
+                if entry is None:
+                    return await assets_files.get_response(asset_path, request.scope)
+                return _cached_response(request, entry, IMMUTABLE_CACHE_CONTROL)
+
+        # index.html references the hashed assets, so browsers must revalidate
+        # it to pick up a new build; the ETag turns repeat visits into a 304
+        index_entry = static_cache["index.html"]
+
+        # Root index
+        @app.get("/")
+        async def serve_root(request: Request) -> Response:  # type: ignore[override]
+            return _cached_response(request, index_entry, "no-cache")
+
+        # SPA fallback: if requested path is a file in dist, serve it; otherwise index.html.
+        # Files are looked up among those cached at startup, so there is no stat
+        # per request and no path can reach outside dist
+        @app.get("/{full_path:path}")
+        async def spa_fallback(full_path: str, request: Request) -> Response:  # type: ignore[override]
+            if ".." not in full_path and not full_path.startswith("/"):
+                entry = static_cache.get(full_path)
+                if entry is not None:
+                    return _cached_response(request, entry, "no-cache")
+            return _cached_response(request, index_entry, "no-cache")
 
 
 def create_app() -> FastAPI:
@@ -34,6 +161,8 @@ def create_app() -> FastAPI:
     allow_origins = [o.strip() for o in origins_env.split(",") if o.strip()]
 
     # Configure CORS. If wildcard is used, credentials cannot be allowed.
+    # Preflights are cached for 2h (Chrome's cap); changing allow_methods or
+    # allow_headers only takes effect once cached preflights expire.
     app.add_middleware(
         CORSMiddleware,
         allow_origins=allow_origins,
@@ -41,27 +170,37 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
         expose_headers=["set-cookie"],
-        max_age=600,
+        max_age=7200,
     )
 
     # Cookie-based sessions
     secret_key = os.environ.get("SECRET_KEY", "dev-insecure-secret")
     app.add_middleware(SessionMiddleware, secret_key=secret_key, same_site="lax")
 
-    # Initialize database (creates tables if needed)
-    init_db()
+    # Initialize database (creates tables if needed). With several workers,
+    # set INIT_DB_ON_STARTUP=false and create the schema once beforehand.
+    if _env_flag("INIT_DB_ON_STARTUP", True):
+        init_db()
 
     # On startup, sync favorites with latest events.json so mobile clients
-    # receive up-to-date fields (including coordinates)
-    @app.on_event("startup")
-    async def _sync_favorites_on_startup() -> None:
-        base_dir = Path(__file__).resolve().parents[2]  # website/
-        data_dir = base_dir / "backend" / "data"
-        db = SessionLocal()
-        try:
-            sync_favorites_with_events(db, data_dir)
-        finally:
-            db.close()
+    # receive up-to-date fields (including coordinates). The sync runs in a
+    # worker thread so the server accepts connections right away; it can also
+    # be run once outside the web process with `python -m app.services.favorites_sync`.
+    if _env_flag("RUN_FAVORITES_SYNC", True):
+
+        @app.on_event("startup")
+        async def _sync_favorites_on_startup() -> None:
+            asyncio.get_running_loop().run_in_executor(None, _run_favorites_sync)
+
+    # Load the FAISS index and open the OpenAI connections in the background so
+    # the first search does not pay for them; the server accepts connections
+    # meanwhile, and a search arriving early waits on the same load.
+    if _env_flag("WARMUP_ON_STARTUP", True):
+
+        @app.on_event("startup")
+        async def _warm_up_on_startup() -> None:
+            # Keep a reference so the task is not garbage collected mid-run
+            app.state.warm_up_task = asyncio.get_running_loop().create_task(_warm_up_recommendations())
 
     @app.get("/health")
     async def health() -> dict:
@@ -74,27 +213,7 @@ def create_app() -> FastAPI:
     # --- Frontend static files (Vite build) ---
     # Serve the built frontend from `website/frontend/dist`
     base_dir = Path(__file__).resolve().parents[2]  # website/
-    frontend_dist = base_dir / "frontend" / "dist"
-    index_html = frontend_dist / "index.html"
-
-    if frontend_dist.exists() and index_html.exists():
-        # Serve hashed assets at /assets/*
-        assets_dir = frontend_dist / "assets"
-        if assets_dir.exists():
-            app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-
-        # Root index
-        @app.get("/")
-        async def serve_root() -> FileResponse:  # type: ignore[override]
-            return FileResponse(str(index_html))
-
-        # SPA fallback: if requested path is an existing file in dist, serve it; otherwise index.html
-        @app.get("/{full_path:path}")
-        async def spa_fallback(full_path: str) -> FileResponse:  # type: ignore[override]
-            candidate = frontend_dist / full_path
-            if candidate.is_file():
-                return FileResponse(str(candidate))
-            return FileResponse(str(index_html))
+    mount_frontend(app, base_dir / "frontend" / "dist")
 
     return app
 
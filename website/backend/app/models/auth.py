@@ -12,7 +12,8 @@ class User(Base):
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    username = Column(String(50), nullable=False, index=True)
+    # Looked up through the uq_users_username index; no separate index needed
+    username = Column(String(50), nullable=False)
     password_hash = Column(String(255), nullable=False)
 
 
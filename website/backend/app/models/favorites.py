@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, UniqueConstraint
 
 from app.db import Base
 
@@ -8,8 +8,8 @@ from app.db import Base
 class Favorite(Base):
     __tablename__ = "favorites"
     __table_args__ = (
+        # Its (user_id, event_id) index also serves lookups by user_id alone
         UniqueConstraint("user_id", "event_id", name="uq_favorites_user_event"),
-        Index("ix_favorites_user_id", "user_id"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -72,6 +72,12 @@ def main() -> None:
     service = EmbeddingService(openai_api_key=api_key)
     vectors = service.generate_all_embeddings(events)
 
+    # Store L2-normalized vectors so the server can index them for cosine similarity as-is.
+    # fp16 halves the file; the server quantizes to 8 bits for its index anyway.
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors = (vectors / norms).astype(np.float16)
+
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     np.save(str(output_path), vectors)
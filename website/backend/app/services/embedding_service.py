@@ -1,13 +1,81 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Iterable, List, Optional
 from datetime import datetime
 
 import numpy as np
 import httpx
+import orjson
 
 from app.models.event import Event, EventTime
+from app.services.retry import backoff_delay, is_retryable
+
+
+EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+
+def _span_mask(start: int, end: int) -> int:
+    """Bit mask with one bit per minute of the half-open range [start, end)."""
+    return ((1 << (end - start)) - 1) << start
+
+
+def _to_minutes(hhmm: str) -> Optional[int]:
+    hour_str, sep, minute_str = hhmm.partition(":")
+    if not sep or ":" in minute_str:
+        return None
+    try:
+        hour = int(hour_str)
+        minute = int(minute_str)
+    except ValueError:
+        return None
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None
+    return hour * 60 + minute
+
+
+# Time-of-day buckets as minute-of-day bit masks; overlap with an event span
+# is a single AND of two ints. Bucket ranges (start inclusive, end exclusive):
+_MORNING_MASK = _span_mask(5 * 60, 12 * 60)       # 300–720
+_AFTERNOON_MASK = _span_mask(12 * 60, 17 * 60)    # 720–1020
+_EVENING_MASK = _span_mask(17 * 60, 21 * 60)      # 1020–1260
+_NIGHT_MASK = _span_mask(21 * 60, 24 * 60) | _span_mask(0, 5 * 60)  # 1260–1440, 0–300
+
+# (bucket bit, mask, mask without the first minute of each range)
+_TIME_BUCKETS = (
+    (1, _MORNING_MASK, _MORNING_MASK & ~(1 << (5 * 60))),
+    (2, _AFTERNOON_MASK, _AFTERNOON_MASK & ~(1 << (12 * 60))),
+    (4, _EVENING_MASK, _EVENING_MASK & ~(1 << (17 * 60))),
+    (8, _NIGHT_MASK, _NIGHT_MASK & ~(1 << (21 * 60)) & ~1),
+)
+# Bucket name -> bit in a time_bucket_mask result, in summary order
+TIME_BUCKET_BITS = {"morning": 1, "afternoon": 2, "evening": 4, "night": 8}
+
+
+def time_bucket_mask(start_time: str, end_time: str) -> int:
+    """Return the time-of-day buckets an HH:MM span overlaps as TIME_BUCKET_BITS flags.
+
+    Spans ending before they start wrap over midnight; a zero-length span
+    counts for a bucket it falls strictly inside. Unparseable times give 0.
+    """
+    start = _to_minutes(start_time)
+    end = _to_minutes(end_time)
+    if start is None or end is None:
+        return 0
+
+    if end > start:
+        span = _span_mask(start, end)
+    elif end < start:
+        span = _span_mask(start, 24 * 60) | _span_mask(0, end)
+    else:
+        span = 1 << start
+
+    found = 0
+    for bit, mask, interior in _TIME_BUCKETS:
+        if span & (mask if end != start else interior):
+            found |= bit
+    return found
 
 
 class EmbeddingService:
@@ -26,16 +94,61 @@ class EmbeddingService:
     ) -> None:
         self._api_key = openai_api_key
         self._client: Optional[httpx.Client] = None
+        # Query embeddings for the web app go through an async client bound to
+        # the event loop that created it
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
         self.model = model
         self.max_retries = max_retries
         self.initial_backoff_s = initial_backoff_s
 
     def _get_client(self) -> httpx.Client:
         if self._client is None:
-            timeout = httpx.Timeout(60.0)
-            self._client = httpx.Client(timeout=timeout)
+            # One long-lived HTTP/2 connection to the API is reused across calls
+            timeout = httpx.Timeout(60.0, connect=5.0)
+            limits = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60)
+            self._client = httpx.Client(http2=True, timeout=timeout, limits=limits)
         return self._client
 
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # Concurrent requests multiplex over the pooled HTTP/2 connections
+            timeout = httpx.Timeout(60.0, connect=5.0)
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=60)
+            self._async_client = httpx.AsyncClient(http2=True, timeout=timeout, limits=limits)
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the API so the first query skips the TLS handshake."""
+        try:
+            # Any response will do; only the connection is kept
+            await self._get_async_client().head(EMBEDDINGS_URL)
+        except httpx.HTTPError:
+            pass  # Best effort; the first real request connects instead
+
+    def _request_kwargs(self, texts: List[str]) -> dict:
+        return {
+            "headers": {
+                "Authorization": f"Bearer {self._api_key}",
+                "Content-Type": "application/json",
+            },
+            "json": {
+                "model": self.model,
+                "input": texts,
+            },
+        }
+
+    @staticmethod
+    def _parse_embeddings(resp: httpx.Response) -> List[List[float]]:
+        resp.raise_for_status()
+        # Each vector is tens of KB of JSON floats; orjson decodes them
+        # straight from the response bytes
+        payload = orjson.loads(resp.content)
+        data = sorted(payload["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+
     def _build_event_text(self, event: Event) -> str:
         """Compose a concise text representation of an event for embedding."""
         # Only essential fields per YAGNI
@@ -63,55 +176,10 @@ class EmbeddingService:
             - evening:   17:00–20:59
             - night:     21:00–04:59 (wraps midnight)
         """
-        def to_minutes(hhmm: str) -> Optional[int]:
-            try:
-                parts = hhmm.split(":")
-                if len(parts) != 2:
-                    return None
-                hour = int(parts[0])
-                minute = int(parts[1])
-                if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                    return None
-                return hour * 60 + minute
-            except Exception:
-                return None
-
-        # Bucket ranges (start inclusive, end exclusive) in minutes
-        MORNING = (5 * 60, 12 * 60)       # 300–720
-        AFTERNOON = (12 * 60, 17 * 60)    # 720–1020
-        EVENING = (17 * 60, 21 * 60)      # 1020–1260
-        NIGHT_1 = (21 * 60, 24 * 60)      # 1260–1440
-        NIGHT_2 = (0, 5 * 60)             # 0–300
-
-        def overlaps(a_start: int, a_end: int, b_start: int, b_end: int) -> bool:
-            return a_start < b_end and a_end > b_start
-
-        found = set()
+        found = 0
         for t in times:
-            start = to_minutes(t.start_time)
-            end = to_minutes(t.end_time)
-            if start is None or end is None:
-                continue
-
-            # Normalize intervals; handle wrap over midnight
-            segments: List[tuple[int, int]]
-            if end >= start:
-                segments = [(start, end)]
-            else:
-                segments = [(start, 24 * 60), (0, end)]
-
-            for seg_start, seg_end in segments:
-                if overlaps(seg_start, seg_end, *MORNING):
-                    found.add("morning")
-                if overlaps(seg_start, seg_end, *AFTERNOON):
-                    found.add("afternoon")
-                if overlaps(seg_start, seg_end, *EVENING):
-                    found.add("evening")
-                if overlaps(seg_start, seg_end, *NIGHT_1) or overlaps(seg_start, seg_end, *NIGHT_2):
-                    found.add("night")
-
-        bucket_order = ["morning", "afternoon", "evening", "night"]
-        return [b for b in bucket_order if b in found]
+            found |= time_bucket_mask(t.start_time, t.end_time)
+        return [name for name, bit in TIME_BUCKET_BITS.items() if found & bit]
 
     @staticmethod
     def _summarize_weekdays(times: List[EventTime]) -> List[str]:
@@ -149,62 +217,83 @@ class EmbeddingService:
 
     def generate_text_embedding(self, text: str) -> List[float]:
         """Generate an embedding for arbitrary text using OpenAI API with retries."""
-        backoff = self.initial_backoff_s
+        return self.generate_text_embeddings([text])[0]
+
+    def generate_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts in one API request, with retries.
+
+        Returns one vector per input text, in input order.
+        """
         last_error: Optional[Exception] = None
 
-        for _ in range(self.max_retries):
+        for attempt in range(self.max_retries):
             try:
-                resp = self._get_client().post(
-                    "https://api.openai.com/v1/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "input": text,
-                    },
-                )
-                resp.raise_for_status()
-                payload = resp.json()
-                return payload["data"][0]["embedding"]  # type: ignore[no-any-return]
+                resp = self._get_client().post(EMBEDDINGS_URL, **self._request_kwargs(texts))
+                return self._parse_embeddings(resp)
             except Exception as exc:  # Broad by design to keep deps minimal
                 last_error = exc
-                time.sleep(backoff)
-                backoff = min(backoff * 2, 30.0)
+                if not is_retryable(exc) or attempt == self.max_retries - 1:
+                    break
+                time.sleep(backoff_delay(attempt, self.initial_backoff_s))
 
         # If all retries failed, re-raise last error
         assert last_error is not None
         raise last_error
 
+    async def agenerate_text_embedding(self, text: str) -> List[float]:
+        """Async generate_text_embedding: waits on the API without holding a thread."""
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries):
+            try:
+                resp = await self._get_async_client().post(EMBEDDINGS_URL, **self._request_kwargs([text]))
+                return self._parse_embeddings(resp)[0]
+            except Exception as exc:  # Broad by design to keep deps minimal
+                last_error = exc
+                if not is_retryable(exc) or attempt == self.max_retries - 1:
+                    break
+                await asyncio.sleep(backoff_delay(attempt, self.initial_backoff_s))
+
+        assert last_error is not None
+        raise last_error
+
     def generate_all_embeddings(
         self,
         events: Iterable[Event],
         progress_interval: int = 100,
         dtype: np.dtype = np.float32,
+        batch_size: int = 128,
     ) -> np.ndarray:
         """Generate embeddings for all events.
 
+        Events are sent ``batch_size`` at a time, one API request per batch.
+
         Args:
             events: Iterable of Event models
             progress_interval: Print progress every N events
             dtype: dtype for the resulting numpy array
+            batch_size: Number of events embedded per request
 
         Returns:
             np.ndarray of shape (num_events, embedding_dim)
         """
-        embeddings: List[List[float]] = []
-        for index, event in enumerate(events, start=1):
-            vector = self.generate_event_embedding(event)
-            embeddings.append(vector)
-            if progress_interval and index % progress_interval == 0:
-                print(f"Processed {index} events...")
-
-        # Infer dimension from first embedding
-        if not embeddings:
+        events = list(events)
+        if not events:
             return np.empty((0, 0), dtype=dtype)
 
-        arr = np.asarray(embeddings, dtype=dtype)
-        return arr
-
-
+        # Sized from the first batch's dimension and filled batch by batch,
+        # so no list of Python floats for the whole run is kept around
+        out: Optional[np.ndarray] = None
+        for done_before in range(0, len(events), batch_size):
+            batch = events[done_before : done_before + batch_size]
+            vectors = np.asarray(
+                self.generate_text_embeddings([self._build_event_text(e) for e in batch]), dtype=dtype
+            )
+            if out is None:
+                out = np.empty((len(events), vectors.shape[1]), dtype=dtype)
+            done = done_before + len(batch)
+            out[done_before:done] = vectors
+            if progress_interval and done // progress_interval > done_before // progress_interval:
+                print(f"Processed {done} events...")
+
+        return out
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+
+class _EventItems(list):
+    """Parsed events.json; a list subclass so the cache can hold it weakly."""
+
+    __slots__ = ("__weakref__",)
+
+
+_lock = threading.Lock()
+# (path, mtime_ns, size) of the last parse and a weak reference to its result
+_cached_key: Tuple[str, int, int] | None = None
+_cached_ref: Optional[Callable[[], Optional[_EventItems]]] = None
+
+
+def load_events_json(events_path: Path) -> List[Dict[str, Any]]:
+    """Parse an events.json file, sharing the parse with concurrent readers.
+
+    The recommendation service and the startup favorites sync both read
+    events.json at startup; while one still holds the parsed list, the other
+    gets the same list without parsing again. Only a weak reference is kept,
+    so the list is freed once no caller holds it; both keep only what they
+    derive from it. Callers must treat the returned dicts as read-only.
+    """
+    global _cached_key, _cached_ref
+    stat = events_path.stat()
+    key = (str(events_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        items = _cached_ref() if _cached_ref is not None and key == _cached_key else None
+        if items is None:
+            items = _EventItems(orjson.loads(events_path.read_bytes()))
+            _cached_key = key
+            _cached_ref = weakref.ref(items)
+        return items
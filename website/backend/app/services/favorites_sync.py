@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Collection, List
 
+import orjson
 from sqlalchemy.orm import Session
 
+from app.db import DATA_DIR, SessionLocal, init_db
 from app.models.favorites import Favorite
+from app.services.events_data import load_events_json
 
 
-def _load_events_map(data_dir: Path) -> Dict[str, Dict[str, Any]]:
-    events_path = data_dir / "events.json"
-    with events_path.open("r", encoding="utf-8") as f:
-        items: List[Dict[str, Any]] = json.load(f)
-    return {str(it.get("id")): it for it in items}
+def _load_events_map(data_dir: Path, event_ids: Collection[str]) -> Dict[str, Dict[str, Any]]:
+    """Map id -> event for the given ids only."""
+    items = load_events_json(data_dir / "events.json")
+    return {event_id: it for it in items if (event_id := str(it.get("id"))) in event_ids}
 
 
 def sync_favorites_with_events(db: Session, data_dir: Path) -> int:
@@ -24,32 +25,51 @@ def sync_favorites_with_events(db: Session, data_dir: Path) -> int:
     - If the event id no longer exists, set its description to "DELETED" while
       preserving the other known fields if present.
 
-    Returns number of favorites updated.
+    Favorites whose stored JSON is already current are left untouched; the
+    rest are written in a single bulk UPDATE.
+
+    Returns number of favorites whose stored JSON changed.
     """
-    events_map = _load_events_map(data_dir)
+    rows = db.query(Favorite.id, Favorite.event_id, Favorite.event_json).all()
+    if not rows:
+        return 0
+    events_map = _load_events_map(data_dir, {str(row.event_id) for row in rows})
+    # Popular events are favorited by many users; serialize each one once
+    serialized = {event_id: orjson.dumps(ev).decode() for event_id, ev in events_map.items()}
 
-    favorites = db.query(Favorite).all()
-    updated = 0
-    for fav in favorites:
-        event_id = str(fav.event_id)
-        if event_id in events_map:
+    payloads: List[Dict[str, Any]] = []
+    for fav_id, fav_event_id, event_json in rows:
+        event_id = str(fav_event_id)
+        if event_id in serialized:
             # Overwrite completely with latest event object
-            latest = events_map[event_id]
-            fav.event_json = json.dumps(latest, ensure_ascii=False)
-            updated += 1
+            new_json = serialized[event_id]
         else:
             # Mark as deleted: update description field only, keep other fields if possible
             try:
-                current = json.loads(fav.event_json)
+                current = orjson.loads(event_json)
             except Exception:
                 current = {"id": event_id}
             current["description"] = "DELETED"
-            fav.event_json = json.dumps(current, ensure_ascii=False)
-            updated += 1
+            new_json = orjson.dumps(current).decode()
+        # After the first sync most favorites are unchanged; skip those writes
+        if new_json != event_json:
+            payloads.append({"id": fav_id, "event_json": new_json})
 
-    if updated:
+    if payloads:
+        db.bulk_update_mappings(Favorite, payloads)
         db.commit()
-    return updated
+    return len(payloads)
+
 
+def run_favorites_sync(data_dir: Path = DATA_DIR) -> int:
+    """Open a session, sync all favorites with ``data_dir/events.json``, and close it."""
+    db = SessionLocal()
+    try:
+        return sync_favorites_with_events(db, data_dir)
+    finally:
+        db.close()
 
 
+if __name__ == "__main__":
+    init_db()
+    print(f"Updated {run_favorites_sync()} favorites")
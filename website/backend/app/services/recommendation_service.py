@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple, Optional, Tuple, Set
+from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime
 import re
 
@@ -12,61 +14,271 @@ import numpy as np
 from dotenv import load_dotenv
 
 from app.models.event import Event
-from app.services.embedding_service import EmbeddingService
-from app.services.rerank_service import RerankService
+from app.services.embedding_service import EmbeddingService, TIME_BUCKET_BITS, time_bucket_mask
+from app.services.events_data import load_events_json
+from app.services.rerank_service import (
+    CrossEncoderRerankService,
+    DEFAULT_CROSS_ENCODER_MODEL,
+    RationaleService,
+    RerankService,
+)
+
+
+# Built from embeddings.npy on first start and reused while it is newer
+INDEX_FILENAME = "embeddings.hnsw-sq8.faiss"
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 128  # ~99% recall@50 against exact fp32 search on the 2025 events
+FAISS_SEARCH_THREADS = 1  # OpenMP threads once the index is loaded
+QUERY_EMBEDDING_CACHE_SIZE = 1024  # ~12 MB of float32 vectors
+RERANK_CACHE_SIZE = 512
+RATIONALE_EVENTS = 5  # Top reranked events the rationale is written about
+RATIONALE_CACHE_SIZE = 512
+
+
+# Weekday detection with aliases (Monday=0..Sunday=6)
+WEEKDAY_ALIASES = {
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2,
+    "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+}
+# Time-of-day buckets with synonyms
+BUCKET_ALIASES = {
+    "morning": "morning",
+    "afternoon": "afternoon",
+    "evening": "evening",
+    "night": "night",
+    "late night": "night",
+    "latenight": "night",
+    "tonight": "night",  # heuristic
+}
+
+
+def _alias_pattern(aliases: Dict[str, object]) -> re.Pattern[str]:
+    # Longer phrases first so they win over their prefixes in the alternation
+    alternatives = "|".join(re.escape(a) for a in sorted(aliases, key=len, reverse=True))
+    return re.compile(r"\b(" + alternatives + r")\b")
+
+
+# One pass over the query per category instead of one search per alias
+WEEKDAY_PATTERN = _alias_pattern(WEEKDAY_ALIASES)
+BUCKET_PATTERN = _alias_pattern(BUCKET_ALIASES)
+
+
+def _weekday(date: str) -> Optional[int]:
+    """Monday=0..Sunday=6 for an MM/DD/YYYY date, or None if it does not parse."""
+    try:
+        return datetime.strptime(date, "%m/%d/%Y").weekday()
+    except ValueError:
+        return None
 
 
 class RecommendationService:
-    """Loads events and embeddings, builds a FAISS index, and serves queries."""
+    """Loads events and embeddings, builds a FAISS index, and serves queries.
+
+    Data is loaded on first use rather than at construction, so importing the
+    API module (and answering health checks) does not wait on FAISS.
+    """
 
     def __init__(self, data_dir: Path | None = None, openai_api_key: str | None = None) -> None:
         base = Path(__file__).resolve().parents[2]  # website/backend/
         self.data_dir = data_dir or (base / "data")
         self.events: List[Event] = []
-        self.embeddings: np.ndarray | None = None
+        self.events_by_id: Dict[str, Event] = {}
+        # Per event (aligned with self.events), over all its occurrences:
+        # weekdays (bit = Monday=0..Sunday=6), TIME_BUCKET_BITS, and buckets per
+        # weekday (TIME_BUCKET_BITS << 4 * weekday) for filters on both at once
+        self._weekday_bits = np.zeros(0, dtype=np.uint8)
+        self._bucket_bits = np.zeros(0, dtype=np.uint8)
+        self._weekday_bucket_bits = np.zeros(0, dtype=np.uint32)
         self.index: faiss.Index | None = None
+        # The index's flat 8-bit codes, for exact scans over filtered events
+        self._quantized_vectors: faiss.Index | None = None
         # Load env if not already loaded and pick up API key
         load_dotenv()
         api_key = openai_api_key if openai_api_key is not None else os.environ.get("OPENAI_API_KEY")
         self.embedding_service = EmbeddingService(openai_api_key=api_key)
-        self.rerank_service = RerankService(openai_api_key=api_key)
+        # RERANK_BACKEND=local ranks with a cross-encoder on this machine instead
+        # of a chat model round trip
+        self.rerank_service: RerankService | CrossEncoderRerankService
+        if os.environ.get("RERANK_BACKEND", "openai").lower() == "local":
+            self.rerank_service = CrossEncoderRerankService(
+                os.environ.get("RERANK_LOCAL_MODEL", DEFAULT_CROSS_ENCODER_MODEL)
+            )
+        else:
+            self.rerank_service = RerankService(openai_api_key=api_key)
+        # The rationale comes from a separate small-model call about the reranked
+        # top events, so it never lengthens the rerank reply
+        self.rationale_service = RationaleService(openai_api_key=api_key)
         self.rerank_enabled = os.environ.get("ENABLE_RERANK", "false").lower() in {"1", "true", "yes"}
         self.rerank_top_n = int(os.environ.get("RERANK_TOP_N", "50"))
-        self._load_data()
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        # Festival searches repeat a lot ("tonight", "morning yoga"); a hit skips
+        # the OpenAI round trip entirely. Least recently used first.
+        self._query_embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_embedding_cache_lock = threading.Lock()
+        # Rerank orders per (normalized query, candidate ids), least recently
+        # used first; a hit skips the chat completion
+        self._rerank_cache: OrderedDict[Tuple[str, Tuple[str, ...]], List[str]] = OrderedDict()
+        self._rerank_cache_lock = threading.Lock()
+        # Rationales per (normalized query, ids of the events explained), cached
+        # apart from the order so a failed rationale never discards an order
+        self._rationale_cache: OrderedDict[Tuple[str, Tuple[str, ...]], str] = OrderedDict()
+        self._rationale_cache_lock = threading.Lock()
+        # Per-thread (1, dim) float32 query row reused by find_similar_events
+        self._query_buffers = threading.local()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load_data()
+                # Building the index uses every core; searches are one query at a
+                # time from request threads, where OpenMP fork/join only adds overhead
+                faiss.omp_set_num_threads(FAISS_SEARCH_THREADS)
+                # One throwaway search faults in the index pages and starts the
+                # OpenMP pool so the first real query does not pay for it
+                assert self.index is not None
+                self.index.search(np.zeros((1, self.index.d), dtype=np.float32), 1)
+                self._loaded = True
+
+    async def warm_up(self) -> None:
+        """Load the data and open the API connections ahead of the first request."""
+        await asyncio.to_thread(self._ensure_loaded)
+        warm_ups = [self.embedding_service.warm_up()]
+        if self.rerank_enabled:
+            warm_ups += [self.rerank_service.warm_up(), self.rationale_service.warm_up()]
+        await asyncio.gather(*warm_ups)
+
+    async def _embed_query(self, normalized_query: str) -> np.ndarray:
+        with self._query_embedding_cache_lock:
+            cached = self._query_embedding_cache.get(normalized_query)
+            if cached is not None:
+                self._query_embedding_cache.move_to_end(normalized_query)
+                return cached
+
+        # float32 keeps each cached 3072-dim vector at 12 KB; read-only so a
+        # caller cannot corrupt the cache
+        embedding = await self.embedding_service.agenerate_text_embedding(normalized_query)
+        vector = np.asarray(embedding, dtype=np.float32)
+        vector.flags.writeable = False
+        with self._query_embedding_cache_lock:
+            self._query_embedding_cache[normalized_query] = vector
+            if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embedding_cache.popitem(last=False)
+        return vector
 
     def _load_data(self) -> None:
         events_path = self.data_dir / "events.json"
         embeddings_path = self.data_dir / "embeddings.npy"
-
-        with events_path.open("r", encoding="utf-8") as f:
-            items = json.load(f)
-            self.events = [Event.model_validate(item) for item in items]
-
-        self.embeddings = np.load(str(embeddings_path))
-
-        # Normalize embeddings for cosine similarity (L2 normalized vectors)
-        norms = np.linalg.norm(self.embeddings, axis=1, keepdims=True)
-        norms[norms == 0] = 1.0
-        normalized = self.embeddings / norms
-
-        dim = normalized.shape[1]
-        self.index = faiss.IndexFlatIP(dim)
-        self.index.add(normalized.astype(np.float32))
-
-    def find_similar_events(self, query_embedding: np.ndarray, k: int = 20) -> List[Tuple[int, float]]:
-        """Return list of (event_index, score) sorted by similarity."""
-        assert self.index is not None and self.embeddings is not None
-
-        q = query_embedding.astype(np.float32)
-        # Normalize query for cosine similarity
-        q_norm = np.linalg.norm(q)
-        if q_norm == 0:
-            q = q
+        index_path = self.data_dir / INDEX_FILENAME
+
+        items = load_events_json(events_path)
+        self.events = [Event.model_validate(item) for item in items]
+        # First occurrence wins, matching a front-to-back scan of self.events
+        self.events_by_id = {}
+        for ev in self.events:
+            self.events_by_id.setdefault(ev.id, ev)
+        self._build_filter_bits()
+
+        # Reuse the index built on a previous start unless the embeddings changed
+        if index_path.exists() and index_path.stat().st_mtime >= embeddings_path.stat().st_mtime:
+            self.index = faiss.read_index(str(index_path))
         else:
-            q = q / q_norm
-        q = q.reshape(1, -1)
+            self.index = self._build_index(embeddings_path, index_path)
+        self._quantized_vectors = faiss.downcast_index(self.index.storage)
+
+    def _build_filter_bits(self) -> None:
+        n = len(self.events)
+        self._weekday_bits = np.zeros(n, dtype=np.uint8)
+        self._bucket_bits = np.zeros(n, dtype=np.uint8)
+        self._weekday_bucket_bits = np.zeros(n, dtype=np.uint32)
+        weekdays: Dict[str, Optional[int]] = {}
+        for i, ev in enumerate(self.events):
+            weekday_bits = bucket_bits = weekday_bucket_bits = 0
+            for t in ev.times:
+                if t.date not in weekdays:
+                    weekdays[t.date] = _weekday(t.date)
+                weekday = weekdays[t.date]
+                buckets = time_bucket_mask(t.start_time, t.end_time)
+                bucket_bits |= buckets
+                if weekday is not None:
+                    weekday_bits |= 1 << weekday
+                    weekday_bucket_bits |= buckets << (4 * weekday)
+            self._weekday_bits[i] = weekday_bits
+            self._bucket_bits[i] = bucket_bits
+            self._weekday_bucket_bits[i] = weekday_bucket_bits
 
-        scores, indices = self.index.search(q, k)
+    @staticmethod
+    def _build_index(embeddings_path: Path, index_path: Path) -> faiss.Index:
+
+        # Map the file rather than reading it into the heap, then make the one
+        # float32 copy that is normalized and indexed; it is freed once the
+        # index holds its own quantized codes
+        stored = np.load(str(embeddings_path), mmap_mode="r")
+        vectors = np.array(stored, dtype=np.float32, order="C")
+        del stored
+
+        # Normalize embeddings for cosine similarity (L2 normalized vectors).
+        # The generation script already saves them normalized; renormalizing in
+        # place is cheap and keeps older files correct. Zero vectors stay zero.
+        faiss.normalize_L2(vectors)
+
+        # HNSW graph over inner product: sub-linear search instead of a full scan.
+        # Vectors are stored as 8-bit scalars, a quarter of the memory traffic
+        # of fp32 per distance computation.
+        dim = vectors.shape[1]
+        index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_8bit, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.train(vectors)
+        index.add(vectors)
+        try:
+            faiss.write_index(index, str(index_path))
+        except RuntimeError as exc:  # e.g. read-only data dir; rebuild next start
+            print(f"Could not cache FAISS index at {index_path}: {exc}")
+        return index
+
+    def get_event(self, event_id: str) -> Optional[Event]:
+        """Return the event with the given id, or None."""
+        self._ensure_loaded()
+        return self.events_by_id.get(event_id)
+
+    def find_similar_events(
+        self, query_embedding: np.ndarray, k: int = 20, allowed: Optional[np.ndarray] = None
+    ) -> List[Tuple[int, float]]:
+        """Return list of (event_index, score) sorted by similarity.
+
+        If ``allowed`` (a bool per event) is given, only those events are returned.
+        """
+        self._ensure_loaded()
+        assert self.index is not None and self._quantized_vectors is not None
+
+        # Copy into this thread's reusable float32 row and normalize it in place
+        # for cosine similarity (a zero vector stays zero). Request threads search
+        # concurrently, so each keeps its own buffer.
+        q = getattr(self._query_buffers, "q", None)
+        if q is None or q.shape[1] != self.index.d:
+            q = self._query_buffers.q = np.empty((1, self.index.d), dtype=np.float32)
+        np.copyto(q[0], query_embedding, casting="unsafe")
+        faiss.normalize_L2(q)
+
+        if allowed is None:
+            # Candidate list size trades recall for speed; it must cover k. Passed
+            # per call so concurrent requests never share a mutable setting.
+            params = faiss.SearchParametersHNSW(efSearch=max(HNSW_EF_SEARCH, k))
+            scores, indices = self.index.search(q, k, params=params)
+        else:
+            # HNSW misses matches when few events pass a filter; an exact scan of
+            # the 8-bit codes that skips everything else is both complete and fast
+            bitmap = np.packbits(allowed, bitorder="little")
+            selector = faiss.IDSelectorBitmap(len(allowed), faiss.swig_ptr(bitmap))
+            scores, indices = self._quantized_vectors.search(q, k, params=faiss.SearchParameters(sel=selector))
         result: List[Tuple[int, float]] = []
         for score, idx in zip(scores[0], indices[0]):
             if idx == -1:
@@ -74,65 +286,137 @@ class RecommendationService:
             result.append((int(idx), float(score)))
         return result
 
-    def get_recommendations(self, query: str, max_results: int = 30) -> Tuple[List[Event], Optional[str]]:
+    async def get_recommendations(self, query: str, max_results: int = 30) -> Tuple[List[Event], Optional[str]]:
         if not query or not query.strip():
             return [], None
 
-        vector = self.embedding_service.generate_text_embedding(query)
-        query_vec = np.asarray(vector, dtype=np.float32)
+        # Loading the data and searching are CPU work; they run in worker threads
+        # so the event loop keeps serving other requests' OpenAI calls meanwhile
+        if not self._loaded:
+            await asyncio.to_thread(self._ensure_loaded)
+        # Case and spacing do not change what is being asked for
+        normalized_query = " ".join(query.lower().split())
+        query_vec = await self._embed_query(normalized_query)
         # Fetch more candidates for potential reranking
         initial_k = max(self.rerank_top_n if self.rerank_enabled else max_results, max_results)
-        matches = self.find_similar_events(query_vec, k=initial_k)
-        print(f"Matches: {len(matches)}")
-        # Map matches to events, dedup by id preserving order
-        seen: set[str] = set()
-        candidates: List[Event] = []
-        for idx, _score in matches:
-            ev = self.events[idx]
-            if ev.id not in seen:
-                candidates.append(ev)
-                seen.add(ev.id)
-                #print(f"Added: {ev}")
-            if len(candidates) >= initial_k:
-                break
-
-        # Parse temporal filters (weekday, time-of-day) from query and filter candidates
-        weekday_indexes, time_buckets = self._parse_temporal_filters(query)
-
-        filtered: List[Event] = candidates
-        if weekday_indexes or time_buckets:
-            filtered = [e for e in candidates if self._event_matches_filters(e, weekday_indexes, time_buckets)]
-            # Progressive fallback if over-constrained
-            if not filtered and weekday_indexes and time_buckets:
-                only_weekday = [e for e in candidates if self._event_matches_filters(e, weekday_indexes, None)]
-                filtered = only_weekday or [e for e in candidates if self._event_matches_filters(e, None, time_buckets)]
-
-        working_set = filtered or candidates
+        working_set = await asyncio.to_thread(self._filtered_candidates, query, query_vec, initial_k)
 
         if self.rerank_enabled and working_set:
             try:
-                order, rationale_text = self.rerank_service.rerank(
-                    query,
-                    [
-                        {
-                            "id": e.id,
-                            "title": e.title,
-                            "type": e.type,
-                            "camp": e.camp,
-                            "description": e.description,
-                        }
-                        for e in working_set
-                    ],
-                )
-                id_to_event = {e.id: e for e in working_set}
-                reranked = [id_to_event[i] for i in order if i in id_to_event]
-                return reranked[: max_results], rationale_text
+                order = await self._rerank(query, normalized_query, working_set)
             except Exception:
                 # On failure, fall back to vector order
                 return working_set[: max_results], None
+            id_to_event = {e.id: e for e in working_set}
+            reranked = [id_to_event[i] for i in order if i in id_to_event][: max_results]
+            # Written about the events actually shown first, so it needs the order
+            rationale_text = await self._explain(query, normalized_query, reranked[:RATIONALE_EVENTS])
+            return reranked, rationale_text
 
         return working_set[: max_results], None
 
+    def _filtered_candidates(self, query: str, query_vec: np.ndarray, initial_k: int) -> List[Event]:
+        """Nearest events to query_vec, narrowed by any weekday/time-of-day in the query.
+
+        Filters are applied inside the search, so a narrow filter still yields
+        up to initial_k matching events rather than the few that happen to be
+        among the unfiltered nearest neighbours.
+        """
+        weekday_indexes, time_buckets = self._parse_temporal_filters(query)
+        bucket_mask = sum(TIME_BUCKET_BITS[b] for b in time_buckets) if time_buckets else None
+
+        attempts: List[Tuple[Optional[Set[int]], Optional[int]]] = []
+        if weekday_indexes or bucket_mask:
+            attempts.append((weekday_indexes, bucket_mask))
+            # Progressive fallback if over-constrained
+            if weekday_indexes and bucket_mask:
+                attempts += [(weekday_indexes, None), (None, bucket_mask)]
+
+        matches: List[Tuple[int, float]] = []
+        for weekdays, buckets in attempts:
+            allowed = self._filter_mask(weekdays, buckets)
+            if allowed.any():
+                matches = self.find_similar_events(query_vec, k=initial_k, allowed=allowed)
+                break
+        else:
+            matches = self.find_similar_events(query_vec, k=initial_k)
+
+        # Map matches to events, dedup by id keeping the first (best) match
+        first_index_by_id: Dict[str, int] = {}
+        for idx, _score in matches:
+            first_index_by_id.setdefault(self.events[idx].id, idx)
+        return [self.events[idx] for idx in first_index_by_id.values()]
+
+    def _filter_mask(self, weekday_indexes: Optional[Set[int]], bucket_mask: Optional[int]) -> np.ndarray:
+        """Bool per event: some occurrence is on one of the weekdays and in one of the buckets.
+
+        If both are given, a single occurrence must satisfy both.
+        """
+        if weekday_indexes and bucket_mask:
+            wanted = 0
+            for weekday in weekday_indexes:
+                wanted |= bucket_mask << (4 * weekday)
+            return (self._weekday_bucket_bits & wanted) != 0
+        if weekday_indexes:
+            return (self._weekday_bits & sum(1 << d for d in weekday_indexes)) != 0
+        return (self._bucket_bits & (bucket_mask or 0)) != 0
+
+    async def _rerank(self, query: str, normalized_query: str, working_set: List[Event]) -> List[str]:
+        """Return working_set's event ids in reranked order, reusing the result for a repeated search."""
+        key = (normalized_query, tuple(e.id for e in working_set))
+        with self._rerank_cache_lock:
+            cached = self._rerank_cache.get(key)
+            if cached is not None:
+                self._rerank_cache.move_to_end(key)
+                return cached
+
+        order = await self.rerank_service.rerank(
+            query,
+            [
+                {
+                    "id": e.id,
+                    "title": e.title,
+                    "type": e.type,
+                    "camp": e.camp,
+                    "description": e.description,
+                }
+                for e in working_set
+            ],
+        )
+        with self._rerank_cache_lock:
+            self._rerank_cache[key] = order
+            if len(self._rerank_cache) > RERANK_CACHE_SIZE:
+                self._rerank_cache.popitem(last=False)
+        return order
+
+    async def _explain(self, query: str, normalized_query: str, top_events: List[Event]) -> Optional[str]:
+        """Return a short rationale for top_events, or None if it could not be written."""
+        if not top_events:
+            return None
+        key = (normalized_query, tuple(e.id for e in top_events))
+        with self._rationale_cache_lock:
+            cached = self._rationale_cache.get(key)
+            if cached is not None:
+                self._rationale_cache.move_to_end(key)
+                return cached
+
+        # The rationale is optional; results are still returned without it
+        try:
+            rationale = await self.rationale_service.explain(
+                query,
+                [{"title": e.title, "type": e.type, "description": e.description} for e in top_events],
+            )
+        except Exception as exc:
+            print(f"Rationale generation failed: {exc}")
+            return None
+        if not rationale:
+            return None
+        with self._rationale_cache_lock:
+            self._rationale_cache[key] = rationale
+            if len(self._rationale_cache) > RATIONALE_CACHE_SIZE:
+                self._rationale_cache.popitem(last=False)
+        return rationale
+
     # --- Internal helpers for temporal parsing and filtering ---
     @staticmethod
     def _parse_temporal_filters(query: str) -> Tuple[Optional[Set[int]], Optional[Set[str]]]:
@@ -143,113 +427,7 @@ class RecommendationService:
             and time_buckets are in {"morning","afternoon","evening","night"}.
         """
         q = query.lower()
-        # Weekday detection with aliases
-        weekday_aliases = {
-            "monday": 0, "mon": 0,
-            "tuesday": 1, "tue": 1, "tues": 1,
-            "wednesday": 2, "wed": 2,
-            "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
-            "friday": 4, "fri": 4,
-            "saturday": 5, "sat": 5,
-            "sunday": 6, "sun": 6,
-        }
-        weekday_indexes: Set[int] = set()
-        for token, idx in weekday_aliases.items():
-            if re.search(r"\b" + re.escape(token) + r"\b", q):
-                weekday_indexes.add(idx)
-
-        # Time-of-day buckets with synonyms
-        bucket_aliases = {
-            "morning": "morning",
-            "afternoon": "afternoon",
-            "evening": "evening",
-            "night": "night",
-            "late night": "night",
-            "latenight": "night",
-            "tonight": "night",  # heuristic
-        }
-        time_buckets: Set[str] = set()
-        # Longer phrases first to avoid partial matches
-        for phrase in sorted(bucket_aliases.keys(), key=len, reverse=True):
-            if re.search(r"\b" + re.escape(phrase) + r"\b", q):
-                time_buckets.add(bucket_aliases[phrase])
+        weekday_indexes: Set[int] = {WEEKDAY_ALIASES[token] for token in WEEKDAY_PATTERN.findall(q)}
+        time_buckets: Set[str] = {BUCKET_ALIASES[phrase] for phrase in BUCKET_PATTERN.findall(q)}
 
         return (weekday_indexes or None), (time_buckets or None)
-
-    @staticmethod
-    def _event_matches_filters(event: Event, weekday_indexes: Optional[Set[int]], time_buckets: Optional[Set[str]]) -> bool:
-        """Return True if the event matches all provided filters.
-
-        - If weekday_indexes provided, at least one occurrence must be on one of those weekdays.
-        - If time_buckets provided, at least one occurrence must overlap one of those buckets.
-        If both provided, a single occurrence must satisfy both (same occurrence).
-        """
-        def to_minutes(hhmm: str) -> Optional[int]:
-            try:
-                hh, mm = hhmm.split(":")
-                h = int(hh); m = int(mm)
-                if 0 <= h <= 23 and 0 <= m <= 59:
-                    return h * 60 + m
-                return None
-            except Exception:
-                return None
-
-        # Bucket ranges (start inclusive, end exclusive)
-        MORNING = (5 * 60, 12 * 60)
-        AFTERNOON = (12 * 60, 17 * 60)
-        EVENING = (17 * 60, 21 * 60)
-        NIGHT_1 = (21 * 60, 24 * 60)
-        NIGHT_2 = (0, 5 * 60)
-
-        def overlaps(a_start: int, a_end: int, b_start: int, b_end: int) -> bool:
-            return a_start < b_end and a_end > b_start
-
-        def matches_bucket(seg_start: int, seg_end: int, bucket: str) -> bool:
-            if bucket == "morning":
-                return overlaps(seg_start, seg_end, *MORNING)
-            if bucket == "afternoon":
-                return overlaps(seg_start, seg_end, *AFTERNOON)
-            if bucket == "evening":
-                return overlaps(seg_start, seg_end, *EVENING)
-            if bucket == "night":
-                return overlaps(seg_start, seg_end, *NIGHT_1) or overlaps(seg_start, seg_end, *NIGHT_2)
-            return False
-
-        for t in event.times:
-            # Parse weekday
-            weekday_ok = True
-            if weekday_indexes is not None:
-                try:
-                    dt = datetime.strptime(t.date, "%m/%d/%Y")
-                    weekday_ok = (dt.weekday() in weekday_indexes)
-                except Exception:
-                    weekday_ok = False
-
-            if not weekday_ok:
-                continue
-
-            # Parse time and evaluate buckets
-            bucket_ok = True
-            if time_buckets is not None:
-                start = to_minutes(t.start_time)
-                end = to_minutes(t.end_time)
-                if start is None or end is None:
-                    bucket_ok = False
-                else:
-                    segments: List[tuple[int, int]]
-                    if end >= start:
-                        segments = [(start, end)]
-                    else:
-                        segments = [(start, 24 * 60), (0, end)]
-                    bucket_ok = any(
-                        matches_bucket(seg_start, seg_end, bucket)
-                        for bucket in time_buckets
-                        for seg_start, seg_end in segments
-                    )
-
-            if weekday_ok and bucket_ok:
-                return True
-
-        return False
-
-
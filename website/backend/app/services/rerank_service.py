@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-import json
-import time
-from typing import List, Optional, Sequence, Tuple, Any
+import asyncio
+import threading
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
 
 import httpx
+import orjson
 
+from app.services.retry import backoff_delay, is_retryable
 
-class RerankService:
-    """Minimal Chat-based reranking using OpenAI Chat Completions API.
+try:
+    from sentence_transformers import CrossEncoder
+except ImportError:  # Optional: only needed for RERANK_BACKEND=local
+    CrossEncoder = None
+
+
+CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+T = TypeVar("T")
+DEFAULT_CROSS_ENCODER_MODEL = "BAAI/bge-reranker-base"
 
-    Sends the query and a compact list of candidate items and expects a JSON
-    array of event IDs ordered from best to worst.
-    """
+
+class ChatCompletionsClient:
+    """Shared OpenAI Chat Completions plumbing: pooled async client and retries."""
 
     def __init__(
         self,
@@ -23,107 +32,222 @@ class RerankService:
         request_timeout_s: float = 60.0,
     ) -> None:
         self._api_key = openai_api_key
-        self._client: Optional[httpx.Client] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         self.model = model
         self.max_retries = max_retries
         self.initial_backoff_s = initial_backoff_s
         self.request_timeout_s = request_timeout_s
 
-    def _get_client(self) -> httpx.Client:
-        if self._client is None:
-            timeout = httpx.Timeout(self.request_timeout_s)
-            self._client = httpx.Client(timeout=timeout)
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # One long-lived client per event loop; concurrent calls multiplex
+            # over its pooled HTTP/2 connections
+            timeout = httpx.Timeout(self.request_timeout_s, connect=5.0)
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=60)
+            self._client = httpx.AsyncClient(http2=True, timeout=timeout, limits=limits)
+            self._client_loop = loop
         return self._client
 
-    def rerank(
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the API so the first call skips the TLS handshake."""
+        try:
+            # Any response will do; only the connection is kept
+            await self._get_client().head(CHAT_COMPLETIONS_URL)
+        except httpx.HTTPError:
+            pass  # Best effort; the first real request connects instead
+
+    async def _complete(self, request: dict, parse: Callable[[str], T]) -> T:
+        """Send a chat completion and return parse(reply content), with retries.
+
+        ``request`` holds the body fields besides the model. A ValueError from
+        ``parse`` (an unusable reply) is retried like a transient error.
+        """
+        # Serialized once and sent as-is on every attempt
+        body = orjson.dumps({"model": self.model, **request})
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.max_retries):
+            try:
+                resp = await self._get_client().post(
+                    CHAT_COMPLETIONS_URL,
+                    headers={
+                        "Authorization": f"Bearer {self._api_key}",
+                        "Content-Type": "application/json",
+                    },
+                    content=body,
+                )
+                resp.raise_for_status()
+                payload = orjson.loads(resp.content)
+                return parse(payload["choices"][0]["message"]["content"])  # type: ignore[index]
+            except Exception as exc:
+                last_error = exc
+                if not is_retryable(exc) or attempt == self.max_retries - 1:
+                    break
+                await asyncio.sleep(backoff_delay(attempt, self.initial_backoff_s))
+
+        assert last_error is not None
+        raise last_error
+
+
+def _compact_candidates(candidates: Sequence[dict], fields: Sequence[str]) -> List[dict]:
+    # Keep prompts compact: a short description is enough signal
+    return [
+        {
+            **{field: c.get(field, "") for field in fields},
+            "description": (c.get("description", "") or "")[:120],
+        }
+        for c in candidates
+    ]
+
+
+class RerankService(ChatCompletionsClient):
+    """Minimal Chat-based reranking using OpenAI Chat Completions API.
+
+    Sends the query and a compact list of candidate items and expects a JSON
+    object listing the event IDs ordered from best to worst.
+    """
+
+    async def rerank(
         self,
         query: str,
         candidates: Sequence[dict],
-    ) -> Tuple[List[str], Optional[str]]:
-        """Return a tuple: (ordered candidate IDs, optional 2-sentence rationale).
+    ) -> List[str]:
+        """Return the candidate IDs ordered from best to worst match.
 
         Each candidate must be a dict with keys: id, title, type, camp, description.
         """
+        # JSON mode guarantees a parseable object, so the prompt only has to
+        # describe its fields. The reply is ids only; output tokens dominate latency.
         system_msg = (
-            "You are a helpful assistant that re-ranks event candidates. "
-            "Given a user query and a list of events, respond with a compact JSON object with two fields: "
-            '"order": an array of event ids sorted from best to worst match, and '
-            '"rationale": a fun, playful, upbeat explanation (max 2 sentences) describing why the selected events match the query. '
-            "Keep it concise and friendly; you may include at most one fitting emoji. "
-            "Respond with JSON only, no extra commentary."
+            "Re-rank event candidates for the user's query. Reply with a JSON object "
+            'whose "order" field lists the event ids from best to worst match.'
         )
 
-        # Keep prompt compact by truncating description
-        compact = [
+        messages = [
+            {"role": "system", "content": system_msg},
             {
-                "id": c.get("id", ""),
-                "title": c.get("title", ""),
-                "type": c.get("type", ""),
-                "camp": c.get("camp", ""),
-                "description": (c.get("description", "") or "")[:240],
-            }
-            for c in candidates
+                "role": "user",
+                # orjson output is already compact
+                "content": orjson.dumps(
+                    {
+                        "query": query,
+                        "candidates": _compact_candidates(candidates, ("id", "title", "type", "camp")),
+                    }
+                ).decode(),
+            },
         ]
+        #print(f"Messages: {messages}")
+
+        def parse(content: str) -> List[str]:
+            # Expect an object { order: [...] }
+            parsed: Any = orjson.loads(content)
+            if (
+                isinstance(parsed, dict)
+                and isinstance(parsed.get("order"), list)
+                and all(isinstance(x, str) for x in parsed["order"])  # type: ignore[index]
+            ):
+                return parsed["order"]  # type: ignore[return-value]
+            raise ValueError("Invalid re-rank response structure")
+
+        return await self._complete(
+            {
+                "messages": messages,
+                "temperature": 0.0,
+                "response_format": {"type": "json_object"},
+            },
+            parse,
+        )
 
+
+class RationaleService(ChatCompletionsClient):
+    """Writes the short, playful "why these events" blurb shown with results.
+
+    Kept apart from ordering so it can use a small, fast model instead of
+    lengthening the rerank reply; it is given the reranked top events.
+    """
+
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        max_retries: int = 2,
+        max_tokens: int = 80,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(openai_api_key=openai_api_key, model=model, max_retries=max_retries, **kwargs)
+        self.max_tokens = max_tokens
+
+    async def explain(self, query: str, candidates: Sequence[dict]) -> str:
+        """Return a rationale of at most 2 sentences for why the candidates match the query.
+
+        Each candidate must be a dict with keys: title, type, description.
+        """
+        system_msg = (
+            "In at most 2 sentences, give a fun, playful, upbeat explanation of why these events "
+            "match the user's query. Keep it concise and friendly; you may include at most one "
+            "fitting emoji. Reply with the explanation only."
+        )
         messages = [
             {"role": "system", "content": system_msg},
             {
                 "role": "user",
-                "content": json.dumps(
+                "content": orjson.dumps(
                     {
                         "query": query,
-                        "candidates": compact,
+                        "events": _compact_candidates(candidates, ("title", "type")),
                     }
-                ),
+                ).decode(),
             },
         ]
-        #print(f"Messages: {messages}")
+        return await self._complete({"messages": messages, "max_tokens": self.max_tokens}, str.strip)
 
-        backoff = self.initial_backoff_s
-        last_error: Optional[Exception] = None
 
-        for _ in range(self.max_retries):
-            try:
-                resp = self._get_client().post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": messages,
-                        "temperature": 0.0,
-                    },
-                )
-                resp.raise_for_status()
-                payload = resp.json()
-                content = (
-                    payload["choices"][0]["message"]["content"].strip()  # type: ignore[index]
-                )
-                # Expect either an object { order: [...], rationale: "..." } or legacy array
-                parsed: Any = json.loads(content)
-                if isinstance(parsed, list) and all(isinstance(x, str) for x in parsed):
-                    return parsed, None
-                if (
-                    isinstance(parsed, dict)
-                    and isinstance(parsed.get("order"), list)
-                    and all(isinstance(x, str) for x in parsed["order"])  # type: ignore[index]
-                ):
-                    rationale_val = parsed.get("rationale")
-                    rationale_str: Optional[str] = (
-                        str(rationale_val).strip() if isinstance(rationale_val, str) else None
-                    )
-                    return parsed["order"], rationale_str  # type: ignore[return-value]
-                # If not valid, fall through to retry once
-                last_error = ValueError("Invalid re-rank response structure")
-            except Exception as exc:
-                last_error = exc
-                time.sleep(backoff)
-                backoff = min(backoff * 2, 30.0)
+class CrossEncoderRerankService:
+    """Reranking with a local cross-encoder instead of a chat model call.
 
-        if last_error is not None:
-            raise last_error
-        return [], None
+    Scores each (query, title + description) pair on CPU in tens of
+    milliseconds per batch, with no API cost. Requires the optional
+    ``sentence-transformers`` package.
+    """
 
+    def __init__(self, model_name: str = DEFAULT_CROSS_ENCODER_MODEL, batch_size: int = 32) -> None:
+        if CrossEncoder is None:
+            raise RuntimeError("RERANK_BACKEND=local requires the sentence-transformers package")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        # Loaded on first use so importing the API module stays fast
+        self._model: Optional[Any] = None
+        self._model_lock = threading.Lock()
+
+    def _get_model(self) -> Any:
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = CrossEncoder(self.model_name)
+        return self._model
+
+    async def warm_up(self) -> None:
+        """Load the model ahead of the first rerank."""
+        await asyncio.to_thread(self._get_model)
+
+    def _rank(self, query: str, candidates: Sequence[dict]) -> List[str]:
+        pairs = [
+            (query, f"{c.get('title', '')} {(c.get('description', '') or '')[:240]}")
+            for c in candidates
+        ]
+        scores = self._get_model().predict(pairs, batch_size=self.batch_size)
+        ranked = sorted(zip(scores, range(len(candidates))), key=lambda item: item[0], reverse=True)
+        return [candidates[i].get("id", "") for _score, i in ranked]
 
+    async def rerank(
+        self,
+        query: str,
+        candidates: Sequence[dict],
+    ) -> List[str]:
+        """Return the candidate IDs ordered from best to worst; same interface as RerankService.rerank."""
+        if not candidates:
+            return []
+        # Inference is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._rank, query, candidates)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import random
+
+import httpx
+
+
+# Statuses worth retrying; other 4xx (bad key, bad request) fail the same way again
+RETRY_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+MAX_BACKOFF_S = 30.0
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Whether a failed OpenAI call may succeed if sent again."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUS_CODES
+    # Network errors, timeouts and malformed responses
+    return True
+
+
+def backoff_delay(attempt: int, initial_backoff_s: float) -> float:
+    """Seconds to wait after failed attempt ``attempt`` (0-based).
+
+    Exponential with full jitter, so concurrent requests that failed together
+    (e.g. on a shared 429) do not all retry in the same instant.
+    """
+    return random.uniform(0.0, min(MAX_BACKOFF_S, initial_backoff_s * 2 ** attempt))